@@ -17,51 +17,139 @@ Abjad's microtonal extension.
 
     The fonts can be found at http://www.ekmelic-music.org/en/extra/ekmelos.htm and http://www.plainsound.org/ respectively and should be installed into the folders at ``/LilyPond.app/Contents/Resources/share/lilypond/current/fonts`` and the computer's font database such as `Font Book`.
 """
+import importlib
+import typing
+
 from ._version import __version__, __version_info__
-from .et import (
-    ETBundle,
-    apply_alteration,
-    get_accidental_value,
-    get_alteration,
-    get_value_sum,
-)
-from .ji import (
-    JIBundle,
-    JIVector,
-    make_ji_bundle,
-    return_cent_deviation_markup,
-    tune_to_ratio,
-)
-from .utilities import (
-    PitchClassSegment,
-    PitchClassSet,
-    PitchSegment,
-    PitchSet,
-    RatioClassSegment,
-    RatioClassSet,
-    RatioSegment,
-    RatioSet,
-)
+from .cache import LRUCache
+
+if typing.TYPE_CHECKING:
+    from .catalog import SetClass, SetClassCatalog
+    from .et import (
+        ETBundle,
+        alteration_cache,
+        apply_alteration,
+        apply_alterations,
+        get_accidental_value,
+        get_alteration,
+        get_value_sum,
+    )
+    from .ji import (
+        JIBundle,
+        JIVector,
+        cents_deviation,
+        factor_ratio,
+        factor_ratios,
+        make_ji_bundle,
+        ratio_to_cents,
+        ratios_to_cents_arrays,
+        return_cent_deviation_markup,
+        tune_to_ratio,
+        tune_to_ratios,
+        tuning_cache,
+    )
+    from .lattice import RatioLattice
+    from .utilities import (
+        EDOPitchClassSet,
+        PitchClassSegment,
+        PitchClassSet,
+        PitchSegment,
+        PitchSet,
+        RatioClassSegment,
+        RatioClassSet,
+        RatioSegment,
+        RatioSet,
+        reduce_ratio_classes,
+    )
+
+# public name -> submodule; submodules import abjad and load on first access
+_name_to_module = {
+    "EDOPitchClassSet": "utilities",
+    "ETBundle": "et",
+    "JIBundle": "ji",
+    "JIVector": "ji",
+    "PitchClassSegment": "utilities",
+    "PitchClassSet": "utilities",
+    "PitchSegment": "utilities",
+    "PitchSet": "utilities",
+    "RatioClassSegment": "utilities",
+    "RatioClassSet": "utilities",
+    "RatioLattice": "lattice",
+    "RatioSegment": "utilities",
+    "RatioSet": "utilities",
+    "SetClass": "catalog",
+    "SetClassCatalog": "catalog",
+    "alteration_cache": "et",
+    "apply_alteration": "et",
+    "apply_alterations": "et",
+    "cents_deviation": "ji",
+    "factor_ratio": "ji",
+    "factor_ratios": "ji",
+    "get_accidental_value": "et",
+    "get_alteration": "et",
+    "get_value_sum": "et",
+    "make_ji_bundle": "ji",
+    "ratio_to_cents": "ji",
+    "ratios_to_cents_arrays": "ji",
+    "reduce_ratio_classes": "utilities",
+    "return_cent_deviation_markup": "ji",
+    "tune_to_ratio": "ji",
+    "tune_to_ratios": "ji",
+    "tuning_cache": "ji",
+}
+
+_submodules = ("cache", "catalog", "et", "ji", "lattice", "utilities")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_name_to_module))
+
+
+def __getattr__(name):
+    if name in _name_to_module:
+        module = importlib.import_module(f".{_name_to_module[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    if name in _submodules:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
+    "EDOPitchClassSet",
     "ETBundle",
     "JIBundle",
     "JIVector",
+    "LRUCache",
     "PitchClassSegment",
     "PitchClassSet",
     "PitchSegment",
     "PitchSet",
     "RatioClassSegment",
     "RatioClassSet",
+    "RatioLattice",
     "RatioSegment",
     "RatioSet",
+    "SetClass",
+    "SetClassCatalog",
     "__version__",
     "__version_info__",
+    "alteration_cache",
     "apply_alteration",
+    "apply_alterations",
+    "cents_deviation",
+    "factor_ratio",
+    "factor_ratios",
     "get_accidental_value",
     "get_alteration",
     "get_value_sum",
     "make_ji_bundle",
+    "ratio_to_cents",
+    "ratios_to_cents_arrays",
+    "reduce_ratio_classes",
     "return_cent_deviation_markup",
     "tune_to_ratio",
+    "tune_to_ratios",
+    "tuning_cache",
 ]
@@ -0,0 +1,253 @@
+"""
+Package for bounded caches.
+"""
+import collections
+
+
+class LRUCache:
+    """
+    LRU cache.
+
+    >>> from abjadext import microtones
+
+    ..  container:: example
+
+        >>> cache = microtones.LRUCache(maxsize=2)
+        >>> cache["a"] = 1
+        >>> cache["b"] = 2
+        >>> cache.get("a")
+        1
+
+        >>> cache["c"] = 3
+        >>> "b" in cache
+        False
+
+        >>> cache.get("b") is None
+        True
+
+        >>> cache.hits, cache.misses, cache.currsize
+        (1, 1, 2)
+
+    """
+
+    def __init__(self, maxsize=1024):
+        if maxsize is not None:
+            assert 0 <= maxsize, repr(maxsize)
+        self._entries = collections.OrderedDict()
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+
+    def __contains__(self, key):
+        """
+        Is true when ``key`` is cached.
+
+        Does not count as a hit or a miss.
+
+        ..  container:: example
+
+            >>> cache = microtones.LRUCache()
+            >>> cache["a"] = 1
+            >>> "a" in cache
+            True
+
+        """
+        return key in self._entries
+
+    def __len__(self):
+        """
+        Gets number of cached entries.
+
+        ..  container:: example
+
+            >>> cache = microtones.LRUCache()
+            >>> cache["a"] = 1
+            >>> len(cache)
+            1
+
+        """
+        return len(self._entries)
+
+    def __repr__(self):
+        """
+        Gets interpreter representation.
+
+        ..  container:: example
+
+            >>> microtones.LRUCache(maxsize=16)
+            LRUCache(hits=0, misses=0, maxsize=16, currsize=0)
+
+        """
+        return (
+            f"{type(self).__name__}(hits={self._hits}, misses={self._misses},"
+            f" maxsize={self._maxsize}, currsize={len(self._entries)})"
+        )
+
+    def __setitem__(self, key, value):
+        """
+        Caches ``value`` at ``key`` and evicts least recently used entries.
+
+        ..  container:: example
+
+            >>> cache = microtones.LRUCache(maxsize=1)
+            >>> cache["a"] = 1
+            >>> cache["b"] = 2
+            >>> list(cache.keys())
+            ['b']
+
+        """
+        if self._maxsize == 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def _evict(self):
+        if self._maxsize is None:
+            return
+        while self._maxsize < len(self._entries):
+            self._entries.popitem(last=False)
+
+    @property
+    def currsize(self):
+        """
+        Gets number of cached entries.
+
+        ..  container:: example
+
+            >>> microtones.LRUCache().currsize
+            0
+
+        """
+        return len(self._entries)
+
+    @property
+    def hit_rate(self):
+        """
+        Gets ratio of hits to lookups.
+
+        ..  container:: example
+
+            >>> cache = microtones.LRUCache()
+            >>> cache.hit_rate
+            0.0
+
+            >>> cache["a"] = 1
+            >>> cache.get("a"), cache.get("b")
+            (1, None)
+
+            >>> cache.hit_rate
+            0.5
+
+        """
+        lookups = self._hits + self._misses
+        if lookups == 0:
+            return 0.0
+        return self._hits / lookups
+
+    @property
+    def hits(self):
+        """
+        Gets number of lookups that found a cached entry.
+
+        ..  container:: example
+
+            >>> microtones.LRUCache().hits
+            0
+
+        """
+        return self._hits
+
+    @property
+    def maxsize(self):
+        """
+        Gets and sets maximum number of cached entries.
+
+        ``None`` leaves the cache unbounded; ``0`` disables caching.
+
+        ..  container:: example
+
+            >>> cache = microtones.LRUCache(maxsize=3)
+            >>> for key in "abc":
+            ...     cache[key] = key
+            ...
+            >>> cache.maxsize = 1
+            >>> list(cache.keys())
+            ['c']
+
+        """
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, argument):
+        if argument is not None:
+            assert 0 <= argument, repr(argument)
+        self._maxsize = argument
+        self._evict()
+
+    @property
+    def misses(self):
+        """
+        Gets number of lookups that found no cached entry.
+
+        ..  container:: example
+
+            >>> microtones.LRUCache().misses
+            0
+
+        """
+        return self._misses
+
+    def clear(self):
+        """
+        Clears cached entries and resets statistics.
+
+        ..  container:: example
+
+            >>> cache = microtones.LRUCache()
+            >>> cache["a"] = 1
+            >>> cache.get("a")
+            1
+
+            >>> cache.clear()
+            >>> cache
+            LRUCache(hits=0, misses=0, maxsize=1024, currsize=0)
+
+        """
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key, default=None):
+        """
+        Gets value cached at ``key`` and marks it most recently used.
+
+        ..  container:: example
+
+            >>> cache = microtones.LRUCache()
+            >>> cache.get("a", 0)
+            0
+
+        """
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self._misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def keys(self):
+        """
+        Gets cached keys from least to most recently used.
+
+        ..  container:: example
+
+            >>> cache = microtones.LRUCache()
+            >>> cache["a"] = 1
+            >>> list(cache.keys())
+            ['a']
+
+        """
+        return self._entries.keys()
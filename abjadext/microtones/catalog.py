@@ -0,0 +1,374 @@
+"""
+Package for set-class catalogs.
+"""
+import struct
+
+from .utilities import EDOPitchClassSet, PitchClassSet
+
+# magic, format version, EDO, number of set classes
+_header = struct.Struct("<4sHHI")
+
+_magic = b"MTSC"
+
+_version = 1
+
+
+def _iterate_necklaces(length, total):
+    # Fredricksen-Kessler-Maiorana enumeration of the lexicographically least
+    # rotations of sequences of positive integers with given length and sum
+    parts = [0] * (length + 1)
+
+    def recurse(t, p, subtotal):
+        if t > length:
+            if length % p == 0 and subtotal == total:
+                yield parts[1:]
+            return
+        remaining = length - t
+        first = parts[1] if 1 < t else 1
+        for part in range(parts[t - p] if 1 < t else 1, total + 1):
+            # every later part is at least the first part
+            if total < subtotal + part + remaining * (part if t == 1 else first):
+                break
+            parts[t] = part
+            if part == parts[t - p] and 1 < t:
+                yield from recurse(t + 1, p, subtotal + part)
+            else:
+                yield from recurse(t + 1, t, subtotal + part)
+
+    yield from recurse(1, 1, 0)
+
+
+def _get_least_rotation(sequence):
+    return min(sequence[i:] + sequence[:i] for i in range(len(sequence)))
+
+
+def _iterate_bracelet_masks(edo, cardinality):
+    # a set of cardinality k is a necklace of k successive intervals summing to
+    # edo; bracelets identify a necklace with its reversal, that is, inversion
+    if cardinality == 0:
+        yield 0
+        return
+    for necklace in _iterate_necklaces(cardinality, edo):
+        if _get_least_rotation(necklace[::-1]) < necklace:
+            continue
+        mask, position = 0, 0
+        for interval in necklace:
+            mask |= 1 << position
+            position += interval
+        yield mask
+
+
+class SetClass:
+    """
+    Set class.
+
+    >>> from abjadext import microtones
+
+    ..  container:: example
+
+        >>> catalog = microtones.SetClassCatalog(12, cardinalities=[3])
+        >>> catalog[10]
+        SetClass(name='3-11', prime_form=EDOPitchClassSet([0, 3, 7], edo=12))
+
+        >>> set_class = catalog[10]
+        >>> set_class.interval_vector
+        (0, 0, 1, 1, 1, 0)
+
+        >>> set_class.symmetry
+        1
+
+    """
+
+    __slots__ = ("_index", "_interval_vector", "_name", "_prime_form", "_symmetry")
+
+    def __init__(self, index, name, prime_form):
+        self._index = index
+        self._name = name
+        self._prime_form = prime_form
+        self._interval_vector = None
+        self._symmetry = None
+
+    def __eq__(self, argument):
+        """
+        Is true when ``argument`` is a set class with equal name and prime form.
+        """
+        if not isinstance(argument, type(self)):
+            return False
+        return (self._name, self._prime_form) == (argument._name, argument._prime_form)
+
+    def __hash__(self):
+        """
+        Hashes set class.
+        """
+        return hash((type(self), self._name, self._prime_form))
+
+    def __repr__(self):
+        """
+        Gets interpreter representation.
+        """
+        name = type(self).__name__
+        return f"{name}(name={self._name!r}, prime_form={self._prime_form!r})"
+
+    @property
+    def index(self):
+        """
+        Gets index in catalog.
+        """
+        return self._index
+
+    @property
+    def interval_vector(self):
+        """
+        Gets interval-class vector.
+        """
+        if self._interval_vector is None:
+            self._interval_vector = self._prime_form.interval_vector()
+        return self._interval_vector
+
+    @property
+    def name(self):
+        """
+        Gets name: cardinality and 1-based position among set classes of that
+        cardinality ordered by prime-form bitmask.
+
+        Names are not Forte numbers, even in 12-EDO: the catalog numbers set
+        classes in bitmask order, which Forte's ordering does not follow.
+
+        ..  container:: example
+
+            Forte 3-4 is (015), but catalog set class 3-4 is (024):
+
+            >>> catalog = microtones.SetClassCatalog(12, cardinalities=[3])
+            >>> catalog[3].name
+            '3-4'
+
+            >>> catalog[3].prime_form
+            EDOPitchClassSet([0, 2, 4], edo=12)
+
+        """
+        return self._name
+
+    @property
+    def prime_form(self):
+        """
+        Gets prime form.
+        """
+        return self._prime_form
+
+    @property
+    def symmetry(self):
+        """
+        Gets number of transpositions and inversions that map set class onto
+        itself.
+        """
+        if self._symmetry is None:
+            self._symmetry = self._prime_form.symmetry()
+        return self._symmetry
+
+
+class SetClassCatalog:
+    """
+    Set-class catalog.
+
+    Enumerates set classes of ``edo`` under transposition and inversion as
+    bracelets of interval successions instead of filtering all subsets.
+    Orders set classes by cardinality and then by prime-form bitmask, so
+    set-class names are catalog positions, not Forte numbers.
+
+    >>> from abjadext import microtones
+
+    ..  container:: example
+
+        >>> catalog = microtones.SetClassCatalog(12)
+        >>> len(catalog)
+        224
+
+        >>> catalog.get_set_class([7, 11, 2])
+        SetClass(name='3-11', prime_form=EDOPitchClassSet([0, 3, 7], edo=12))
+
+        >>> catalog = microtones.SetClassCatalog(24, cardinalities=range(3, 5))
+        >>> len(catalog)
+        304
+
+    ..  container:: example
+
+        Writes masks to a compact binary file and reads them back:
+
+        >>> import pathlib, tempfile
+        >>> directory = tempfile.TemporaryDirectory()
+        >>> path = pathlib.Path(directory.name) / "24-edo.sc"
+        >>> catalog.write(path)
+        >>> microtones.SetClassCatalog.read(path) == catalog
+        True
+
+        >>> directory.cleanup()
+
+    """
+
+    __slots__ = ("_cardinality_to_start", "_edo", "_mask_to_index", "_masks")
+
+    def __init__(self, edo=12, cardinalities=None):
+        assert isinstance(edo, int) and 0 < edo, repr(edo)
+        if cardinalities is None:
+            cardinalities = range(edo + 1)
+        masks = []
+        for cardinality in sorted(set(cardinalities)):
+            assert 0 <= cardinality <= edo, repr(cardinality)
+            prime_forms = set()
+            for mask in _iterate_bracelet_masks(edo, cardinality):
+                pc_set = EDOPitchClassSet.from_mask(mask, edo)
+                prime_forms.add(pc_set.prime_form().mask)
+            masks.extend(sorted(prime_forms))
+        self._initialize(edo, masks)
+
+    def __eq__(self, argument):
+        """
+        Is true when ``argument`` is a catalog with equal EDO and set classes.
+        """
+        if not isinstance(argument, type(self)):
+            return False
+        return (self._edo, self._masks) == (argument._edo, argument._masks)
+
+    def __getitem__(self, index):
+        """
+        Gets set class at ``index``.
+
+        ..  container:: example
+
+            >>> catalog = microtones.SetClassCatalog(12, cardinalities=[3])
+            >>> catalog[-1]
+            SetClass(name='3-12', prime_form=EDOPitchClassSet([0, 4, 8], edo=12))
+
+            >>> catalog[-1].index
+            11
+
+        ..  container:: example
+
+            Gets list of set classes at slice:
+
+            >>> for set_class in catalog[-3:]:
+            ...     set_class
+            ...
+            SetClass(name='3-10', prime_form=EDOPitchClassSet([0, 2, 7], edo=12))
+            SetClass(name='3-11', prime_form=EDOPitchClassSet([0, 3, 7], edo=12))
+            SetClass(name='3-12', prime_form=EDOPitchClassSet([0, 4, 8], edo=12))
+
+        """
+        if isinstance(index, slice):
+            return [self[_] for _ in range(len(self._masks))[index]]
+        index = range(len(self._masks))[index]
+        mask = self._masks[index]
+        cardinality = bin(mask).count("1")
+        position = index - self._cardinality_to_start[cardinality] + 1
+        prime_form = EDOPitchClassSet.from_mask(mask, self._edo)
+        return SetClass(index, f"{cardinality}-{position}", prime_form)
+
+    def __hash__(self):
+        """
+        Hashes catalog.
+        """
+        return hash((type(self), self._edo, tuple(self._masks)))
+
+    def __iter__(self):
+        """
+        Iterates set classes.
+        """
+        for index in range(len(self._masks)):
+            yield self[index]
+
+    def __len__(self):
+        """
+        Gets number of set classes.
+        """
+        return len(self._masks)
+
+    def __repr__(self):
+        """
+        Gets interpreter representation.
+
+        ..  container:: example
+
+            >>> microtones.SetClassCatalog(12, cardinalities=[2])
+            SetClassCatalog(edo=12, set_classes=6)
+
+        """
+        return f"{type(self).__name__}(edo={self._edo}, set_classes={len(self)})"
+
+    def _initialize(self, edo, masks):
+        self._edo = edo
+        self._masks = masks
+        self._mask_to_index = {mask: i for i, mask in enumerate(masks)}
+        # masks are sorted by cardinality, so each cardinality starts once
+        cardinality_to_start: dict = {}
+        for i, mask in enumerate(masks):
+            cardinality_to_start.setdefault(bin(mask).count("1"), i)
+        self._cardinality_to_start = cardinality_to_start
+
+    @property
+    def edo(self):
+        """
+        Gets number of equal divisions of the octave.
+        """
+        return self._edo
+
+    @classmethod
+    def read(class_, path):
+        """
+        Reads catalog written by ``SetClassCatalog.write()``.
+        """
+        with open(path, "rb") as pointer:
+            data = pointer.read()
+        magic, version, edo, count = _header.unpack_from(data)
+        assert magic == _magic, repr(magic)
+        assert version == _version, repr(version)
+        width = (edo + 7) // 8
+        masks = []
+        offset = _header.size
+        for _ in range(count):
+            masks.append(int.from_bytes(data[offset : offset + width], "little"))
+            offset += width
+        catalog = class_.__new__(class_)
+        catalog._initialize(edo, masks)
+        return catalog
+
+    def get_set_class(self, argument):
+        """
+        Gets set class of ``argument``.
+        """
+        return self[self.index(argument)]
+
+    def index(self, argument):
+        """
+        Gets index of set class of ``argument``.
+
+        ``argument`` may be an EDO pitch class set, a pitch class set of
+        semitone values or integer steps.
+
+        ..  container:: example
+
+            >>> catalog = microtones.SetClassCatalog(24, cardinalities=[3])
+            >>> pc_set = microtones.PitchClassSet([0, "1/2", "11/2"])
+            >>> catalog.index(pc_set)
+            25
+
+            >>> catalog[25].prime_form
+            EDOPitchClassSet([0, 1, 11], edo=24)
+
+        """
+        if isinstance(argument, PitchClassSet):
+            argument = EDOPitchClassSet.from_pitch_class_set(argument, self._edo)
+        elif not isinstance(argument, EDOPitchClassSet):
+            argument = EDOPitchClassSet(argument, self._edo)
+        assert argument.edo == self._edo, repr(argument)
+        return self._mask_to_index[argument.prime_form().mask]
+
+    def write(self, path):
+        """
+        Writes catalog as prime-form bitmasks to binary file at ``path``.
+        """
+        width = (self._edo + 7) // 8
+        chunks = [_header.pack(_magic, _version, self._edo, len(self._masks))]
+        for mask in self._masks:
+            chunks.append(mask.to_bytes(width, "little"))
+        with open(path, "wb") as pointer:
+            pointer.write(b"".join(chunks))
@@ -1,24 +1,77 @@
 """
 Package for equal tempered microtones.
 """
-import math
+import numbers
 
 import abjad
-import black
 import quicktions
 
+from .cache import LRUCache
+
 
 class ETBundle:
-    """
+    r"""
     ET bundle.
 
     >>> from abjadext import microtones
 
+    ..  container:: example
+
+        Bundles are immutable, hashable and picklable:
+
+        >>> import pickle
+        >>> pitch = abjad.NamedPitch("cs'")
+        >>> bundle = microtones.ETBundle(pitch, r"\abjad-sharp-markup")
+        >>> bundle == pickle.loads(pickle.dumps(bundle))
+        True
+
+        >>> len({bundle, microtones.ETBundle(pitch, r"\abjad-sharp-markup")})
+        1
+
     """
 
+    __slots__ = ("_accidental_string", "_hash", "_pitch")
+
     def __init__(self, pitch="c'", accidental_string=None):
-        self.pitch = pitch
-        self.accidental_string = accidental_string
+        object.__setattr__(self, "_pitch", pitch)
+        object.__setattr__(self, "_accidental_string", accidental_string)
+        object.__setattr__(self, "_hash", None)
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is read-only.")
+
+    def __eq__(self, argument):
+        """
+        Is true when ``argument`` is a bundle with equal pitch and accidental
+        string.
+
+        ..  container:: example
+
+            >>> microtones.ETBundle("cs'") == microtones.ETBundle("cs'")
+            True
+
+            >>> microtones.ETBundle("cs'") == microtones.ETBundle("df'")
+            False
+
+        """
+        if not isinstance(argument, type(self)):
+            return False
+        return (
+            self._pitch == argument._pitch
+            and self._accidental_string == argument._accidental_string
+        )
+
+    def __hash__(self):
+        """
+        Hashes bundle.
+        """
+        if self._hash is None:
+            value = hash((type(self), self._pitch, self._accidental_string))
+            object.__setattr__(self, "_hash", value)
+        return self._hash
+
+    def __reduce__(self):
+        return type(self), (self._pitch, self._accidental_string)
 
     def __repr__(self):
         """
@@ -27,17 +80,56 @@ class ETBundle:
         ..  container:: example
 
             >>> microtones.ETBundle()
-            repr not yet defined
+            ETBundle(pitch="c'", accidental_string=None)
+
+        """
+        name = type(self).__name__
+        return (
+            f"{name}(pitch={self._pitch!r},"
+            f" accidental_string={self._accidental_string!r})"
+        )
 
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only.")
+
+    @property
+    def accidental_string(self):
+        r"""
+        Gets accidental string.
+
+        ..  container:: example
+
+            >>> microtones.ETBundle("cs'", r"\abjad-sharp-markup").accidental_string
+            '\\abjad-sharp-markup'
+
+        """
+        return self._accidental_string
+
+    @property
+    def pitch(self):
         """
-        return "repr not yet defined"
+        Gets pitch.
 
-    def __str__(self):
-        string = str(self)
-        string = black.format_str(string, mode=black.mode.Mode())
-        return string
+        Bundles are read-only because ``get_alteration()`` shares them between
+        calls.
+
+        ..  container:: example
+
+            >>> bundle = microtones.ETBundle("cs'")
+            >>> bundle.pitch
+            "cs'"
+
+            >>> bundle.pitch = "d'"
+            Traceback (most recent call last):
+                ...
+            AttributeError: ...
+
+        """
+        return self._pitch
 
 
+alteration_cache = LRUCache(maxsize=1024)
+
 _accidental_to_value = {
     "double sharp": 2,
     "three-quarters sharp": quicktions.Fraction(3 / 2),
@@ -50,6 +142,7 @@ _accidental_to_value = {
     "double flat": -2,
 }
 
+# source table for the default 8th-, 10th- and 12th-tone accidentals
 _value_to_accidental = {
     "2": r"\double-sharp",
     "11/6": r"\eleven-twelfths-sharp",
@@ -100,51 +193,218 @@ _value_to_accidental = {
     "-2": r"\double-flat",
 }
 
-_reversed_value_to_accidental = {
-    r"\double-sharp-markup": "2/1",
-    r"\eleven-twelfths-sharp-markup": "11/6",
-    r"\seven-eighths-sharp-markup": "7/4",
-    r"\five-sixths-sharp-markup": "5/3",
-    r"\four-fifths-sharp-markup": "8/5",
-    r"\three-quarters-sharp-markup": "3/2",
-    r"\two-thirds-sharp-markup": "4/3",
-    r"\five-eighths-sharp-markup": "5/4",
-    r"\three-fifths-sharp-markup": "6/5",
-    r"\seven-twelfths-sharp-markup": "7/6",
-    r"\abjad-sharp-markup": "1/1",
-    r"\five-twelfths-sharp-markup": "5/6",
-    r"\two-fifths-sharp-markup": "4/5",
-    r"\three-eighths-sharp-markup": "3/4",
-    r"\one-third-sharp-markup": "2/3",
-    r"\one-quarter-sharp-markup": "1/2",
-    r"\one-fifth-sharp-markup": "2/5",
-    r"\one-sixth-sharp-markup": "1/3",
-    r"\one-eighth-sharp-markup": "1/4",
-    r"\one-twelfth-sharp-markup": "1/6",
-    r"\abjad-natural-markup": "0",
-    r"\one-twelfth-flat-markup": "-1/6",
-    r"\one-eighth-flat-markup": "-1/4",
-    r"\one-sixth-flat-markup": "-1/3",
-    r"\one-fifth-flat-markup": "-2/5",
-    r"\one-quarter-flat-markup": "-1/2",
-    r"\one-third-flat-markup": "-2/3",
-    r"\three-eighths-flat-markup": "-3/4",
-    r"\two-fifths-flat-markup": "-4/5",
-    r"\five-twelfths-flat-markup": "-5/6",
-    r"\abjad-flat-markup": "-1/1",
-    r"\seven-twelfths-flat-markup": "-7/6",
-    r"\three-fifths-flat-markup": "-6/5",
-    r"\five-eighths-flat-markup": "-5/4",
-    r"\two-thirds-flat-markup": "-4/3",
-    r"\three-quarters-flat-markup": "-3/2",
-    r"\four-fifths-flat-markup": "-8/5",
-    r"\five-sixths-flat-markup": "-5/3",
-    r"\seven-eighths-flat-markup": "-7/4",
-    r"\eleven-twelfths-flat-markup": "-11/6",
-    r"\double-flat-markup": "-2/1",
+_accidental_value_to_abbreviation = {
+    quicktions.Fraction(-3, 2): "tqf",
+    -1: "f",
+    quicktions.Fraction(-1, 2): "qf",
+    0: "",
+    quicktions.Fraction(1, 2): "qs",
+    1: "s",
+    quicktions.Fraction(3, 2): "tqs",
+}
+
+_natural_pitch_class_numbers = {0: "c", 2: "d", 4: "e", 5: "f", 7: "g", 9: "a", 11: "b"}
+
+
+def _make_respelling_table():
+    table = {}
+    for step in range(24):
+        number = quicktions.Fraction(step, 2)
+        natural = max(_ for _ in _natural_pitch_class_numbers if _ <= number)
+        name = _natural_pitch_class_numbers[natural]
+        name += _accidental_value_to_abbreviation[number - natural]
+        table[(number, "sharp")] = (name, 0)
+        natural = min(
+            _ for _ in list(_natural_pitch_class_numbers) + [12] if number <= _
+        )
+        name = _natural_pitch_class_numbers[natural % 12]
+        name += _accidental_value_to_abbreviation[number - natural]
+        table[(number, "flat")] = (name, natural // 12)
+    return table
+
+
+# (pitch-class number, spelling) -> (pitch-class name, octave offset)
+_respelling_table = _make_respelling_table()
+
+_respelled_pitches = LRUCache(maxsize=1024)
+
+
+def _respell(pitch, spell):
+    number = pitch.number
+    key = (number, spell)
+    pitch = _respelled_pitches.get(key)
+    if pitch is None:
+        name, octave_offset = _respelling_table[(number % 12, spell)]
+        octave = int(number // 12) + octave_offset + 4
+        if 3 < octave:
+            name += "'" * (octave - 3)
+        else:
+            name += "," * (3 - octave)
+        pitch = abjad.NamedPitch(name)
+        _respelled_pitches[key] = pitch
+    return pitch
+
+
+_cardinals = (
+    "zero",
+    "one",
+    "two",
+    "three",
+    "four",
+    "five",
+    "six",
+    "seven",
+    "eight",
+    "nine",
+    "ten",
+    "eleven",
+    "twelve",
+    "thirteen",
+    "fourteen",
+    "fifteen",
+    "sixteen",
+    "seventeen",
+    "eighteen",
+    "nineteen",
+)
+
+_tens = ("", "", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty")
+
+_irregular_ordinals = {
+    "one": "first",
+    "two": "second",
+    "three": "third",
+    "four": "quarter",
+    "five": "fifth",
+    "eight": "eighth",
+    "nine": "ninth",
+    "twelve": "twelfth",
 }
 
 
+def _number_to_words(n):
+    assert 0 <= n < 100, repr(n)
+    if n < 20:
+        return _cardinals[n]
+    tens, ones = divmod(n, 10)
+    if ones == 0:
+        return _tens[tens]
+    return f"{_tens[tens]}-{_cardinals[ones]}"
+
+
+def _number_to_ordinal(n):
+    words = _number_to_words(n).split("-")
+    last = words[-1]
+    if last in _irregular_ordinals:
+        last = _irregular_ordinals[last]
+    elif last.endswith("y"):
+        last = last[:-1] + "ieth"
+    else:
+        last += "th"
+    words[-1] = last
+    return "-".join(words)
+
+
+def _value_to_accidental_string(value):
+    if value == 0:
+        return r"\abjad-natural-markup"
+    direction = "sharp" if 0 < value else "flat"
+    magnitude = abs(value)
+    if magnitude == 1:
+        return rf"\abjad-{direction}-markup"
+    if magnitude == 2:
+        return rf"\double-{direction}-markup"
+    tones = magnitude / 2
+    numerator = _number_to_words(tones.numerator)
+    denominator = _number_to_ordinal(tones.denominator)
+    if 1 < tones.numerator:
+        denominator += "s"
+    return rf"\{numerator}-{denominator}-{direction}-markup"
+
+
+class _AccidentalTable:
+    """
+    Accidental strings indexed by integer steps.
+
+    Alterations are counted in ``steps_per_semitone`` steps and offset so that
+    a double flat is index zero.
+    """
+
+    __slots__ = (
+        "accidental_to_steps",
+        "name",
+        "offset",
+        "steps_per_semitone",
+        "strings",
+    )
+
+    def __init__(self, name, steps_per_semitone, value_to_string):
+        self.name = name
+        self.steps_per_semitone = steps_per_semitone
+        self.offset = 2 * steps_per_semitone
+        self.strings = [None] * (2 * self.offset + 1)
+        for value, string in value_to_string.items():
+            steps = quicktions.Fraction(value) * steps_per_semitone
+            assert steps.denominator == 1, repr(value)
+            self.strings[int(steps) + self.offset] = string
+        self.accidental_to_steps = {}
+        for name, value in _accidental_to_value.items():
+            steps = quicktions.Fraction(value) * steps_per_semitone
+            if steps.denominator == 1:
+                self.accidental_to_steps[name] = int(steps)
+
+    def get_string(self, steps):
+        index = steps + self.offset
+        if 0 <= index < len(self.strings) and self.strings[index] is not None:
+            return self.strings[index]
+        value = quicktions.Fraction(steps, self.steps_per_semitone)
+        raise ValueError(f"{value} semitones has no accidental in {self.name}.")
+
+
+_default_accidental_table = _AccidentalTable(
+    "the default eighth-, tenth- and twelfth-tone set",
+    120,
+    {key: value + "-markup" for key, value in _value_to_accidental.items()},
+)
+
+# EDOs whose accidentals are all defined in fraction-accidental-markups.ily
+_supported_edos = (12, 24, 36, 48, 60, 72, 84, 96, 108, 120)
+
+_edo_to_accidental_table: dict = {}
+
+
+def _get_accidental_table(edo):
+    if edo is None:
+        return _default_accidental_table
+    if edo not in _edo_to_accidental_table:
+        if edo not in _supported_edos:
+            edos = ", ".join(str(_) for _ in _supported_edos)
+            raise ValueError(f"edo must be one of {edos}: {edo!r}.")
+        steps_per_semitone = edo // 12
+        value_to_string = {}
+        for step in range(-2 * steps_per_semitone, 2 * steps_per_semitone + 1):
+            value = quicktions.Fraction(step, steps_per_semitone)
+            value_to_string[value] = _value_to_accidental_string(value)
+        table = _AccidentalTable(f"{edo}-EDO", steps_per_semitone, value_to_string)
+        _edo_to_accidental_table[edo] = table
+    return _edo_to_accidental_table[edo]
+
+
+_string_to_value = LRUCache(maxsize=1024)
+
+
+def _get_value(argument):
+    if isinstance(argument, numbers.Rational):
+        return argument
+    if isinstance(argument, str):
+        value = _string_to_value.get(argument)
+        if value is None:
+            value = quicktions.Fraction(argument)
+            _string_to_value[argument] = value
+        return value
+    return quicktions.Fraction(argument)
+
+
 def get_accidental_value(pitch):
     """
     Gets accidental value.
@@ -176,10 +436,18 @@ def get_value_sum(pitch, value):
     return get_accidental_value(pitch) + value
 
 
-def get_alteration(pitch, value, spell=None):
+def get_alteration(pitch, value, spell=None, *, edo=None):
     r"""
     Gets alteration.
 
+    Bundles are memoized in ``alteration_cache`` by pitch, value, spelling and
+    EDO.
+
+    When ``edo`` is set, ``value`` must be a whole number of ``edo`` steps and
+    accidentals are read from tables generated for that EDO. ``edo`` must be a
+    multiple of 12 up to 120, for which the bundled stylesheets define every
+    accidental markup.
+
     ..  container:: example
 
         >>> pitch = abjad.NumberedPitch(0)
@@ -230,41 +498,115 @@ def get_alteration(pitch, value, spell=None):
         >>> bundle.accidental_string
         '\\eleven-twelfths-sharp-markup'
 
+    ..  container:: example
+
+        Repeated alterations are read from ``alteration_cache``:
+
+        >>> microtones.alteration_cache.clear()
+        >>> pitch = abjad.NamedPitch("c'")
+        >>> for _ in range(3):
+        ...     bundle = microtones.get_alteration(pitch, "1/2")
+        ...
+        >>> microtones.alteration_cache.hits, microtones.alteration_cache.misses
+        (2, 1)
+
+        >>> microtones.get_alteration(pitch, "1/2") is bundle
+        True
+
+    ..  container:: example
+
+        Gets accidentals of any EDO that is a multiple of 12:
+
+        >>> pitch = abjad.NamedPitch("c'")
+        >>> microtones.get_alteration(pitch, "5/6", edo=72).accidental_string
+        '\\five-twelfths-sharp-markup'
+
+        >>> microtones.get_alteration(pitch, "-3/8", edo=96).accidental_string
+        '\\three-sixteenths-flat-markup'
+
+        >>> bundle = microtones.get_alteration(pitch, "13/7", "sharp", edo=84)
+        >>> bundle.pitch
+        NamedPitch("cs'")
+
+        >>> bundle.accidental_string
+        '\\thirteen-fourteenths-sharp-markup'
+
+    ..  container:: example
+
+        Raises value error for unsupported EDOs, for values without an
+        accidental and for pitches whose accidental the EDO lacks:
+
+        >>> microtones.get_alteration(pitch, "1/3", edo=30)
+        Traceback (most recent call last):
+            ...
+        ValueError: edo must be one of 12, 24, 36, 48, 60, 72, 84, 96, 108, 120: 30.
+
+        >>> microtones.get_alteration(pitch, "1/4", edo=36)
+        Traceback (most recent call last):
+            ...
+        ValueError: 1/4 semitones has no accidental in 36-EDO.
+
+        >>> microtones.get_alteration(pitch, "1/7")
+        Traceback (most recent call last):
+            ...
+        ValueError: 1/7 semitones has no accidental in the default eighth-, tenth- and twelfth-tone set.
+
+        >>> microtones.get_alteration(pitch, "1/120")
+        Traceback (most recent call last):
+            ...
+        ValueError: 1/120 semitones has no accidental in the default eighth-, tenth- and twelfth-tone set.
+
+        >>> microtones.get_alteration(abjad.NamedPitch("cqs'"), "1/3", edo=36)
+        Traceback (most recent call last):
+            ...
+        ValueError: NamedPitch("cqs'") has accidental 'quarter sharp' missing from 36-EDO.
+
     """
-    value = quicktions.Fraction(value)
-    semitones = int(math.modf(value)[1])
-    remainder = quicktions.Fraction(value - int(math.modf(value)[1]))
+    value = _get_value(value)
+    key = (type(pitch), pitch, value, spell, edo)
+    bundle = alteration_cache.get(key)
+    if bundle is None:
+        table = _get_accidental_table(edo)
+        bundle = _get_alteration(pitch, value, spell, table)
+        alteration_cache[key] = bundle
+    return bundle
+
+
+def _get_accidental_steps(pitch, table):
+    name = pitch.accidental.name
+    if name not in table.accidental_to_steps:
+        message = f"{pitch!r} has accidental {name!r} missing from {table.name}."
+        raise ValueError(message)
+    return table.accidental_to_steps[name]
+
+
+def _get_alteration(pitch, value, spell, table):
+    steps_per_semitone = table.steps_per_semitone
+    steps, remainder = divmod(value.numerator * steps_per_semitone, value.denominator)
+    if remainder != 0:
+        raise ValueError(f"{value} semitones has no accidental in {table.name}.")
+    if 0 <= steps:
+        semitones = steps // steps_per_semitone
+    else:
+        semitones = -(-steps // steps_per_semitone)
+    remainder_steps = steps - semitones * steps_per_semitone
     if semitones != 0:
         pitch = abjad.NumberedInterval(semitones).transpose(pitch)
-    transposed_accidental_value = get_value_sum(pitch, remainder)
-    key = str(transposed_accidental_value)
-    new_accidental = _value_to_accidental[key] + "-markup"
-    if spell is not None:
-        if spell == "sharp":
-            if quicktions.Fraction(_reversed_value_to_accidental[new_accidental]) < 0:
-                # make sharp
-                temp_note = abjad.Note(abjad.NamedPitch(pitch), (1, 4))
-                abjad.iterpitches.respell_with_sharps([temp_note])
-                pitch = temp_note.written_pitch
-                transposed_accidental_value = get_value_sum(pitch, remainder)
-                key = str(transposed_accidental_value)
-                new_accidental = _value_to_accidental[key] + "-markup"
-        if spell == "flat":
-            if 0 < quicktions.Fraction(_reversed_value_to_accidental[new_accidental]):
-                # make flat
-                temp_note = abjad.Note(abjad.NamedPitch(pitch), (1, 4))
-                abjad.iterpitches.respell_with_flats([temp_note])
-                pitch = temp_note.written_pitch
-                transposed_accidental_value = get_value_sum(pitch, remainder)
-                key = str(transposed_accidental_value)
-                new_accidental = _value_to_accidental[key] + "-markup"
-    return ETBundle(pitch, new_accidental)
-
-
-def apply_alteration(note_head, value, spell=None):
+    accidental_steps = _get_accidental_steps(pitch, table)
+    total_steps = accidental_steps + remainder_steps
+    if (spell == "sharp" and total_steps < 0) or (spell == "flat" and 0 < total_steps):
+        pitch = _respell(pitch, spell)
+        accidental_steps = _get_accidental_steps(pitch, table)
+        total_steps = accidental_steps + remainder_steps
+    return ETBundle(pitch, table.get_string(total_steps))
+
+
+def apply_alteration(note_head, value, spell=None, *, edo=None):
     r"""
     Applies alteration.
 
+    Accidentals are read from tables generated for ``edo`` when ``edo`` is set.
+
     ..  container:: example
 
         Eighth tone accidentals:
@@ -441,14 +783,125 @@ def apply_alteration(note_head, value, spell=None):
             }
 
     """
-    value = quicktions.Fraction(value)
     pitch = note_head.written_pitch
-    bundle = get_alteration(pitch, value, spell)
+    bundle = get_alteration(pitch, value, spell, edo=edo)
+    _write_bundle(note_head, bundle)
+
+
+def apply_alterations(argument, values, spell=None, *, edo=None):
+    r"""
+    Applies alterations to every note head in ``argument``.
+
+    ``argument`` may contain notes, chords and note heads. ``values`` is either
+    an iterable paired in order with the items of ``argument`` or a callable
+    that takes a note head and returns its value. Every note head of a chord
+    receives the chord's value. Items without note heads are skipped.
+
+    Each distinct pitch and value is altered only once per call.
+
+    ..  container:: example
+
+        >>> staff = abjad.Staff("c'4 r4 <c' e'>4 c'4")
+        >>> microtones.apply_alterations(staff[:], ["1/2", 0, "3/2", "1/2"])
+        >>> print(abjad.lilypond(staff))
+        \new Staff
+        {
+            \tweak Accidental.stencil #ly:text-interface::print
+            \tweak Accidental.text \one-quarter-sharp-markup
+            c'4
+            r4
+            <
+                \tweak Accidental.stencil #ly:text-interface::print
+                \tweak Accidental.text \one-quarter-flat-markup
+                df'
+                \tweak Accidental.stencil #ly:text-interface::print
+                \tweak Accidental.text \one-quarter-sharp-markup
+                f'
+            >4
+            \tweak Accidental.stencil #ly:text-interface::print
+            \tweak Accidental.text \one-quarter-sharp-markup
+            c'4
+        }
+
+    ..  container:: example
+
+        Calls ``values`` with each note head when ``values`` is callable:
+
+        >>> chord = abjad.Chord("<c' g'>4")
+        >>> def get_value(note_head):
+        ...     if note_head.written_pitch == abjad.NamedPitch("g'"):
+        ...         return "1/3"
+        ...     return "-1/3"
+        ...
+        >>> microtones.apply_alterations([chord], get_value, spell="flat")
+        >>> print(abjad.lilypond(chord))
+        <
+            \tweak Accidental.stencil #ly:text-interface::print
+            \tweak Accidental.text \one-sixth-flat-markup
+            c'
+            \tweak Accidental.stencil #ly:text-interface::print
+            \tweak Accidental.text \one-sixth-sharp-markup
+            g'
+        >4
+
+    ..  container:: example
+
+        Raises value error when ``values`` and ``argument`` differ in length:
+
+        >>> staff = abjad.Staff("c'4 d'4")
+        >>> microtones.apply_alterations(staff[:], ["1/2"])
+        Traceback (most recent call last):
+            ...
+        ValueError: 1 values for 2 items.
+
+    """
+    if callable(values):
+        pairs = [(_, values(_)) for _ in _iterate_note_heads(argument)]
+    else:
+        argument, values = list(argument), list(values)
+        if len(argument) != len(values):
+            raise ValueError(f"{len(values)} values for {len(argument)} items.")
+        pairs = []
+        for item, value in zip(argument, values):
+            for note_head in _iterate_note_heads([item]):
+                pairs.append((note_head, value))
+    value_to_fraction = {}
+    key_to_bundle = {}
+    keys = []
+    for note_head, value in pairs:
+        if value not in value_to_fraction:
+            value_to_fraction[value] = quicktions.Fraction(value)
+        pitch = note_head.written_pitch
+        key = (type(pitch), pitch, value_to_fraction[value])
+        if key not in key_to_bundle:
+            key_to_bundle[key] = get_alteration(pitch, key[-1], spell, edo=edo)
+        keys.append(key)
+    for (note_head, _), key in zip(pairs, keys):
+        _write_bundle(note_head, key_to_bundle[key])
+
+
+_accidental_stencil_tweak = abjad.Tweak(
+    r"\tweak Accidental.stencil #ly:text-interface::print"
+)
+
+_accidental_string_to_tweak = LRUCache(maxsize=1024)
+
+
+def _iterate_note_heads(argument):
+    for item in argument:
+        if isinstance(item, abjad.NoteHead):
+            yield item
+        elif isinstance(item, abjad.Note):
+            yield item.note_head
+        elif isinstance(item, abjad.Chord):
+            yield from item.note_heads
+
+
+def _write_bundle(note_head, bundle):
     note_head.written_pitch = bundle.pitch
-    # string = r"#ly:text-interface::print"
-    # abjad.tweak(note_head, literal=True).Accidental.stencil = string
-    abjad.tweak(note_head, r"\tweak Accidental.stencil #ly:text-interface::print")
-    # abjad.tweak(note_head, literal=True).Accidental.text = bundle.accidental_string
-    abjad.tweak(
-        note_head, rf"\tweak Accidental.text {bundle.accidental_string}"
-    )  # WARNING: may need .string if markup?
+    accidental_string = bundle.accidental_string
+    tweak = _accidental_string_to_tweak.get(accidental_string)
+    if tweak is None:
+        tweak = abjad.Tweak(rf"\tweak Accidental.text {accidental_string}")
+        _accidental_string_to_tweak[accidental_string] = tweak
+    abjad.tweak(note_head, _accidental_stencil_tweak, tweak)
@@ -1,12 +1,154 @@
 """
 Package for Just Intonation.
 """
+import collections
 import math
+import numbers
 
 import abjad
-import black
 import quicktions
 
+from .cache import LRUCache
+from .utilities import _factor_integer
+
+_numerator_factor_to_nudge = {
+    5: "syntonic_commas_down",
+    7: "septimal_commas_down",
+    11: "undecimal_quarter_tones_up",
+    13: "tridecimal_third_tones_down",
+    17: "seventeen_limit_schismas_down",
+    19: "nineteen_limit_schismas_up",
+    23: "twenty_three_limit_commas_up",
+    29: "twenty_nine_limit_commas_up",
+    31: "thirty_one_limit_schismas_down",
+    37: "thirty_seven_limit_quarter_tones_up",
+    41: "forty_one_limit_commas_up",
+    43: "forty_three_limit_commas_up",
+    47: "forty_seven_limit_quarter_tones_up",
+}
+
+_primes = tuple(_numerator_factor_to_nudge)
+
+_nudge_names = (
+    "syntonic_commas_down",
+    "syntonic_commas_up",
+    "septimal_commas_down",
+    "septimal_commas_up",
+    "undecimal_quarter_tones_down",
+    "undecimal_quarter_tones_up",
+    "tridecimal_third_tones_down",
+    "tridecimal_third_tones_up",
+    "seventeen_limit_schismas_down",
+    "seventeen_limit_schismas_up",
+    "nineteen_limit_schismas_down",
+    "nineteen_limit_schismas_up",
+    "twenty_three_limit_commas_down",
+    "twenty_three_limit_commas_up",
+    "twenty_nine_limit_commas_down",
+    "twenty_nine_limit_commas_up",
+    "thirty_one_limit_schismas_down",
+    "thirty_one_limit_schismas_up",
+    "thirty_seven_limit_quarter_tones_down",
+    "thirty_seven_limit_quarter_tones_up",
+    "forty_one_limit_commas_down",
+    "forty_one_limit_commas_up",
+    "forty_three_limit_commas_down",
+    "forty_three_limit_commas_up",
+    "forty_seven_limit_quarter_tones_down",
+    "forty_seven_limit_quarter_tones_up",
+)
+
+
+_prime_to_glyph_name = {
+    5: "syntonic-comma",
+    7: "septimal-comma",
+    11: "undecimal-quarter-tone",
+    13: "tridecimal-third-tone",
+    17: "seventeen-limit-schisma",
+    19: "nineteen-limit-schisma",
+    23: "twenty-three-limit-comma",
+    29: "twenty-nine-limit-comma",
+    31: "thirty-one-limit-schisma",
+    37: "thirty-seven-limit-quarter-tone",
+    41: "forty-one-limit-comma",
+    43: "forty-three-limit-comma",
+    47: "forty-seven-limit-quarter-tone",
+}
+
+_count_to_word = {1: "one", 2: "two", 3: "three"}
+
+_diatonic_accidental_to_glyph_name = {
+    "double flat": "double-flat",
+    "double sharp": "double-sharp",
+}
+
+_diatonic_glyph_name_to_abjad_glyph_name = {
+    "flat": "abjad-flat",
+    "natural": "abjad-natural",
+    "sharp": "abjad-sharp",
+}
+
+_vector_key_to_markup = LRUCache(maxsize=1024)
+
+
+def _get_nudge_string(prime, exponent):
+    if _numerator_factor_to_nudge[prime].endswith("_down"):
+        exponent = -exponent
+    if 0 < exponent:
+        direction = "up"
+    else:
+        direction = "down"
+    word = _count_to_word[abs(exponent)]
+    return rf"\{word}-{_prime_to_glyph_name[prime]}-{direction}"
+
+
+def _make_ji_markup(diatonic_accidental, monzo):
+    name = _diatonic_accidental_to_glyph_name.get(
+        diatonic_accidental, diatonic_accidental
+    )
+    # syntonic commas combine with the diatonic accidental in one glyph
+    if monzo[0] != 0:
+        diatonic_string = rf"\{name}-{_get_nudge_string(5, monzo[0])[1:]}"
+    else:
+        name = _diatonic_glyph_name_to_abjad_glyph_name.get(name, name)
+        diatonic_string = rf"\{name}"
+    strings = []
+    for prime, exponent in reversed(tuple(zip(_primes[1:], monzo[1:]))):
+        if exponent != 0:
+            strings.append(_get_nudge_string(prime, exponent))
+    if not strings or diatonic_string != r"\abjad-natural":
+        strings.append(diatonic_string)
+    if len(strings) == 1:
+        return abjad.Markup(rf"\markup {{ {strings[0]}  }}")
+    string = r" \hspace #0.125 ".join(strings)
+    return abjad.Markup(rf"\markup \concat {{ {string}  }}")
+
+
+def _get_nudge_index_and_sign(name):
+    index = _nudge_names.index(name) // 2
+    if _numerator_factor_to_nudge[_primes[index]] == name:
+        return index, 1
+    return index, -1
+
+
+class _NudgeCount:
+    """
+    Reads one nudge count from a vector's monzo.
+    """
+
+    __slots__ = ("index", "sign")
+
+    def __init__(self, name):
+        self.index, self.sign = _get_nudge_index_and_sign(name)
+
+    def __get__(self, vector, owner=None):
+        if vector is None:
+            return self
+        exponent = self.sign * vector._monzo[self.index]
+        if 0 < exponent:
+            return exponent
+        return 0
+
 
 class JIVector:
     """
@@ -24,8 +166,69 @@ class JIVector:
         >>> vector.syntonic_commas_up
         0
 
+    ..  container:: example
+
+        Stores signed exponents of primes 5 through 47; opposite nudges cancel:
+
+        >>> vector = microtones.JIVector(syntonic_commas_down=2, syntonic_commas_up=1)
+        >>> vector
+        JIVector(syntonic_commas_down=1)
+
+        >>> vector.monzo
+        (1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+
+    ..  container:: example
+
+        Vectors are immutable, hashable and picklable:
+
+        >>> import pickle
+        >>> vector.syntonic_commas_up = 1
+        Traceback (most recent call last):
+            ...
+        AttributeError: JIVector is read-only.
+
+        >>> vector == pickle.loads(pickle.dumps(vector))
+        True
+
     """
 
+    __slots__ = ("_diatonic_accidental", "_hash", "_monzo")
+
+    syntonic_commas_down = _NudgeCount("syntonic_commas_down")
+    syntonic_commas_up = _NudgeCount("syntonic_commas_up")
+    septimal_commas_down = _NudgeCount("septimal_commas_down")
+    septimal_commas_up = _NudgeCount("septimal_commas_up")
+    undecimal_quarter_tones_down = _NudgeCount("undecimal_quarter_tones_down")
+    undecimal_quarter_tones_up = _NudgeCount("undecimal_quarter_tones_up")
+    tridecimal_third_tones_down = _NudgeCount("tridecimal_third_tones_down")
+    tridecimal_third_tones_up = _NudgeCount("tridecimal_third_tones_up")
+    seventeen_limit_schismas_down = _NudgeCount("seventeen_limit_schismas_down")
+    seventeen_limit_schismas_up = _NudgeCount("seventeen_limit_schismas_up")
+    nineteen_limit_schismas_down = _NudgeCount("nineteen_limit_schismas_down")
+    nineteen_limit_schismas_up = _NudgeCount("nineteen_limit_schismas_up")
+    twenty_three_limit_commas_down = _NudgeCount("twenty_three_limit_commas_down")
+    twenty_three_limit_commas_up = _NudgeCount("twenty_three_limit_commas_up")
+    twenty_nine_limit_commas_down = _NudgeCount("twenty_nine_limit_commas_down")
+    twenty_nine_limit_commas_up = _NudgeCount("twenty_nine_limit_commas_up")
+    thirty_one_limit_schismas_down = _NudgeCount("thirty_one_limit_schismas_down")
+    thirty_one_limit_schismas_up = _NudgeCount("thirty_one_limit_schismas_up")
+    thirty_seven_limit_quarter_tones_down = _NudgeCount(
+        "thirty_seven_limit_quarter_tones_down"
+    )
+    thirty_seven_limit_quarter_tones_up = _NudgeCount(
+        "thirty_seven_limit_quarter_tones_up"
+    )
+    forty_one_limit_commas_down = _NudgeCount("forty_one_limit_commas_down")
+    forty_one_limit_commas_up = _NudgeCount("forty_one_limit_commas_up")
+    forty_three_limit_commas_down = _NudgeCount("forty_three_limit_commas_down")
+    forty_three_limit_commas_up = _NudgeCount("forty_three_limit_commas_up")
+    forty_seven_limit_quarter_tones_down = _NudgeCount(
+        "forty_seven_limit_quarter_tones_down"
+    )
+    forty_seven_limit_quarter_tones_up = _NudgeCount(
+        "forty_seven_limit_quarter_tones_up"
+    )
+
     def __init__(
         self,
         diatonic_accidental="natural",
@@ -56,52 +259,181 @@ class JIVector:
         forty_seven_limit_quarter_tones_down=0,
         forty_seven_limit_quarter_tones_up=0,
     ):
-        self.diatonic_accidental = diatonic_accidental
-        self.syntonic_commas_down = syntonic_commas_down
-        self.syntonic_commas_up = syntonic_commas_up
-        self.septimal_commas_down = septimal_commas_down
-        self.septimal_commas_up = septimal_commas_up
-        self.undecimal_quarter_tones_down = undecimal_quarter_tones_down
-        self.undecimal_quarter_tones_up = undecimal_quarter_tones_up
-        self.tridecimal_third_tones_down = tridecimal_third_tones_down
-        self.tridecimal_third_tones_up = tridecimal_third_tones_up
-        self.seventeen_limit_schismas_down = seventeen_limit_schismas_down
-        self.seventeen_limit_schismas_up = seventeen_limit_schismas_up
-        self.nineteen_limit_schismas_down = nineteen_limit_schismas_down
-        self.nineteen_limit_schismas_up = nineteen_limit_schismas_up
-        self.twenty_three_limit_commas_down = twenty_three_limit_commas_down
-        self.twenty_three_limit_commas_up = twenty_three_limit_commas_up
-        self.twenty_nine_limit_commas_down = twenty_nine_limit_commas_down
-        self.twenty_nine_limit_commas_up = twenty_nine_limit_commas_up
-        self.thirty_one_limit_schismas_down = thirty_one_limit_schismas_down
-        self.thirty_one_limit_schismas_up = thirty_one_limit_schismas_up
-        self.thirty_seven_limit_quarter_tones_down = (
-            thirty_seven_limit_quarter_tones_down
+        keywords = locals()
+        monzo = [0] * len(_primes)
+        for name in _nudge_names:
+            count = keywords[name]
+            if count:
+                index, sign = _get_nudge_index_and_sign(name)
+                monzo[index] += sign * count
+        self._initialize(diatonic_accidental, tuple(monzo))
+
+    def __add__(self, argument):
+        """
+        Adds ``argument`` to vector.
+
+        Keeps diatonic accidental of left operand.
+
+        ..  container:: example
+
+            >>> vector = microtones.JIVector(syntonic_commas_down=1)
+            >>> vector + microtones.JIVector(septimal_commas_down=1)
+            JIVector(syntonic_commas_down=1, septimal_commas_down=1)
+
+            >>> vector + microtones.JIVector(syntonic_commas_up=1)
+            JIVector()
+
+        """
+        if not isinstance(argument, type(self)):
+            return NotImplemented
+        monzo = tuple(x + y for x, y in zip(self._monzo, argument._monzo))
+        return type(self).from_monzo(monzo, self._diatonic_accidental)
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is read-only.")
+
+    def __eq__(self, argument):
+        """
+        Is true when ``argument`` is a vector with equal accidentals.
+
+        ..  container:: example
+
+            >>> vector = microtones.JIVector(syntonic_commas_down=1)
+            >>> vector == microtones.JIVector(syntonic_commas_down=1)
+            True
+
+            >>> vector == microtones.JIVector(syntonic_commas_up=1)
+            False
+
+        """
+        if not isinstance(argument, type(self)):
+            return False
+        return (
+            self._monzo == argument._monzo
+            and self._diatonic_accidental == argument._diatonic_accidental
         )
-        self.thirty_seven_limit_quarter_tones_up = thirty_seven_limit_quarter_tones_up
-        self.forty_one_limit_commas_down = forty_one_limit_commas_down
-        self.forty_one_limit_commas_up = forty_one_limit_commas_up
-        self.forty_three_limit_commas_down = forty_three_limit_commas_down
-        self.forty_three_limit_commas_up = forty_three_limit_commas_up
-        self.forty_seven_limit_quarter_tones_down = forty_seven_limit_quarter_tones_down
-        self.forty_seven_limit_quarter_tones_up = forty_seven_limit_quarter_tones_up
+
+    def __hash__(self):
+        """
+        Hashes vector.
+        """
+        if self._hash is None:
+            value = hash((type(self), self._diatonic_accidental, self._monzo))
+            object.__setattr__(self, "_hash", value)
+        return self._hash
+
+    def __neg__(self):
+        """
+        Negates vector.
+
+        ..  container:: example
+
+            >>> -microtones.JIVector(syntonic_commas_down=1)
+            JIVector(syntonic_commas_up=1)
+
+        """
+        monzo = tuple(-_ for _ in self._monzo)
+        return type(self).from_monzo(monzo, self._diatonic_accidental)
+
+    def __reduce__(self):
+        return type(self).from_monzo, (self._monzo, self._diatonic_accidental)
 
     def __repr__(self):
         """
         Gets interpreter representation.
 
+        Omits keywords equal to their defaults.
+
         ..  container:: example
 
             >>> microtones.JIVector()
-            repr not yet defined
+            JIVector()
+
+            >>> microtones.JIVector(diatonic_accidental="sharp", septimal_commas_up=1)
+            JIVector(diatonic_accidental='sharp', septimal_commas_up=1)
 
         """
-        return "repr not yet defined"
+        strings = []
+        if self._diatonic_accidental != "natural":
+            strings.append(f"diatonic_accidental={self._diatonic_accidental!r}")
+        for name in _nudge_names:
+            value = getattr(self, name)
+            if value != 0:
+                strings.append(f"{name}={value!r}")
+        return f"{type(self).__name__}({', '.join(strings)})"
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only.")
+
+    def __sub__(self, argument):
+        """
+        Subtracts ``argument`` from vector.
 
-    def __str__(self):
-        string = str(self)
-        string = black.format_str(string, mode=black.mode.Mode())
-        return string
+        Keeps diatonic accidental of left operand.
+
+        ..  container:: example
+
+            >>> vector = microtones.JIVector(syntonic_commas_down=1)
+            >>> vector - microtones.JIVector(septimal_commas_down=1)
+            JIVector(syntonic_commas_down=1, septimal_commas_up=1)
+
+        """
+        if not isinstance(argument, type(self)):
+            return NotImplemented
+        monzo = tuple(x - y for x, y in zip(self._monzo, argument._monzo))
+        return type(self).from_monzo(monzo, self._diatonic_accidental)
+
+    def _initialize(self, diatonic_accidental, monzo):
+        object.__setattr__(self, "_diatonic_accidental", diatonic_accidental)
+        object.__setattr__(self, "_monzo", monzo)
+        object.__setattr__(self, "_hash", None)
+
+    @property
+    def diatonic_accidental(self):
+        """
+        Gets diatonic accidental.
+
+        ..  container:: example
+
+            >>> microtones.JIVector(diatonic_accidental="flat").diatonic_accidental
+            'flat'
+
+        """
+        return self._diatonic_accidental
+
+    @property
+    def monzo(self):
+        """
+        Gets signed exponents of primes 5 through 47.
+
+        ..  container:: example
+
+            >>> microtones.make_ji_bundle("c'", "7/5").vector.monzo
+            (-1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+
+        """
+        return self._monzo
+
+    @classmethod
+    def from_monzo(class_, monzo, diatonic_accidental="natural"):
+        """
+        Makes vector from signed exponents of primes 5 through 47.
+
+        Exponents of omitted higher primes are zero.
+
+        ..  container:: example
+
+            >>> microtones.JIVector.from_monzo((1, -1))
+            JIVector(syntonic_commas_down=1, septimal_commas_up=1)
+
+        """
+        monzo = tuple(monzo)
+        assert len(monzo) <= len(_primes), repr(monzo)
+        if len(monzo) < len(_primes):
+            monzo += (0,) * (len(_primes) - len(monzo))
+        vector = class_.__new__(class_)
+        vector._initialize(diatonic_accidental, monzo)
+        return vector
 
     def has_just_accidentals(self):
         """
@@ -118,36 +450,7 @@ class JIVector:
             True
 
         """
-        return any(
-            [
-                self.syntonic_commas_down,
-                self.syntonic_commas_up,
-                self.septimal_commas_down,
-                self.septimal_commas_up,
-                self.undecimal_quarter_tones_down,
-                self.undecimal_quarter_tones_up,
-                self.tridecimal_third_tones_down,
-                self.tridecimal_third_tones_up,
-                self.seventeen_limit_schismas_down,
-                self.seventeen_limit_schismas_up,
-                self.nineteen_limit_schismas_down,
-                self.nineteen_limit_schismas_up,
-                self.twenty_three_limit_commas_down,
-                self.twenty_three_limit_commas_up,
-                self.twenty_nine_limit_commas_down,
-                self.twenty_nine_limit_commas_up,
-                self.thirty_one_limit_schismas_down,
-                self.thirty_one_limit_schismas_up,
-                self.thirty_seven_limit_quarter_tones_down,
-                self.thirty_seven_limit_quarter_tones_up,
-                self.forty_one_limit_commas_down,
-                self.forty_one_limit_commas_up,
-                self.forty_three_limit_commas_down,
-                self.forty_three_limit_commas_up,
-                self.forty_seven_limit_quarter_tones_down,
-                self.forty_seven_limit_quarter_tones_up,
-            ]
-        )
+        return any(self._monzo)
 
     def calculate_ji_markup(self):
         r"""
@@ -159,269 +462,34 @@ class JIVector:
             >>> print(abjad.lilypond(vector.calculate_ji_markup()))
             \markup { \natural-one-syntonic-comma-down  }
 
+        Does not change the vector:
+
+            >>> vector
+            JIVector(syntonic_commas_down=1)
+
+        ..  container:: example
+
+            Builds markup once per distinct vector:
+
+            >>> vector = microtones.JIVector(
+            ...     diatonic_accidental="double sharp",
+            ...     septimal_commas_down=1,
+            ...     undecimal_quarter_tones_up=2,
+            ... )
+            >>> markup = vector.calculate_ji_markup()
+            >>> print(abjad.lilypond(markup))
+            \markup \concat { \two-undecimal-quarter-tone-up \hspace #0.125 \one-septimal-comma-down \hspace #0.125 \double-sharp  }
+
+            >>> markup is vector.calculate_ji_markup()
+            True
+
         """
-        int_to_word = {"1": "one", "2": "two", "3": "three"}
-        accumulated_accidentals = []
-        if self.diatonic_accidental == "double sharp":
-            self.diatonic_accidental = "double-sharp"
-        if self.diatonic_accidental == "double flat":
-            self.diatonic_accidental = "double-flat"
-        if self.syntonic_commas_down == self.syntonic_commas_up:
-            self.syntonic_commas_down = 0
-            self.syntonic_commas_up = 0
-            string = rf"\{self.diatonic_accidental}"
-            accumulated_accidentals.append(string)
-        elif self.syntonic_commas_down > self.syntonic_commas_up:
-            self.syntonic_commas_down -= self.syntonic_commas_up
-            self.syntonic_commas_up = 0
-            string = rf"\{self.diatonic_accidental}"
-            string += f"-{int_to_word[str(self.syntonic_commas_down)]}"
-            string += "-syntonic-comma-down"
-            accumulated_accidentals.append(string)
-        else:
-            self.syntonic_commas_up -= self.syntonic_commas_down
-            self.syntonic_commas_down = 0
-            string = rf"\{self.diatonic_accidental}"
-            string += f"-{int_to_word[str(self.syntonic_commas_up)]}"
-            string += "-syntonic-comma-up"
-
-            accumulated_accidentals.append(string)
-        if self.septimal_commas_down == self.septimal_commas_up:
-            self.septimal_commas_down = 0
-            self.septimal_commas_up = 0
-        elif self.septimal_commas_down > self.septimal_commas_up:
-            self.septimal_commas_down -= self.septimal_commas_up
-            self.septimal_commas_up = 0
-            string = rf"\{int_to_word[str(self.septimal_commas_down)]}"
-            string += "-septimal-comma-down"
-            accumulated_accidentals.append(string)
-        else:
-            self.septimal_commas_up -= self.septimal_commas_down
-            self.septimal_commas_down = 0
-            string = rf"\{int_to_word[str(self.septimal_commas_up)]}"
-            string += "-septimal-comma-up"
-            accumulated_accidentals.append(string)
-        if self.undecimal_quarter_tones_down == self.undecimal_quarter_tones_up:
-            self.undecimal_quarter_tones_down = 0
-            self.undecimal_quarter_tones_up = 0
-        elif self.undecimal_quarter_tones_down > self.undecimal_quarter_tones_up:
-            self.undecimal_quarter_tones_down -= self.undecimal_quarter_tones_up
-            self.undecimal_quarter_tones_up = 0
-            string = rf"\{int_to_word[str(self.undecimal_quarter_tones_down)]}"
-            string += "-undecimal-quarter-tone-down"
-            accumulated_accidentals.append(string)
-        else:
-            self.undecimal_quarter_tones_up -= self.undecimal_quarter_tones_down
-            self.undecimal_quarter_tones_down = 0
-            string = rf"\{int_to_word[str(self.undecimal_quarter_tones_up)]}"
-            string += "-undecimal-quarter-tone-up"
-            accumulated_accidentals.append(string)
-        if self.tridecimal_third_tones_down == self.tridecimal_third_tones_up:
-            self.tridecimal_third_tones_down = 0
-            self.tridecimal_third_tones_up = 0
-        elif self.tridecimal_third_tones_down > self.tridecimal_third_tones_up:
-            self.tridecimal_third_tones_down -= self.tridecimal_third_tones_up
-            self.tridecimal_third_tones_up = 0
-            string = rf"\{int_to_word[str(self.tridecimal_third_tones_down)]}"
-            string += "-tridecimal-third-tone-down"
-            accumulated_accidentals.append(string)
-        else:
-            self.tridecimal_third_tones_up -= self.tridecimal_third_tones_down
-            self.tridecimal_third_tones_down = 0
-            string = rf"\{int_to_word[str(self.tridecimal_third_tones_up)]}"
-            string += "-tridecimal-third-tone-up"
-            accumulated_accidentals.append(string)
-        if self.seventeen_limit_schismas_down == self.seventeen_limit_schismas_up:
-            self.seventeen_limit_schismas_down = 0
-            self.seventeen_limit_schismas_up = 0
-        elif self.seventeen_limit_schismas_down > self.seventeen_limit_schismas_up:
-            self.seventeen_limit_schismas_down -= self.seventeen_limit_schismas_up
-            self.seventeen_limit_schismas_up = 0
-            string = rf"\{int_to_word[str(self.seventeen_limit_schismas_down)]}"
-            string += "-seventeen-limit-schisma-down"
-            accumulated_accidentals.append(string)
-        else:
-            self.seventeen_limit_schismas_up -= self.seventeen_limit_schismas_down
-            self.seventeen_limit_schismas_down = 0
-            string = rf"\{int_to_word[str(self.seventeen_limit_schismas_up)]}"
-            string += "-seventeen-limit-schisma-up"
-            accumulated_accidentals.append(string)
-        if self.nineteen_limit_schismas_down == self.nineteen_limit_schismas_up:
-            self.nineteen_limit_schismas_down = 0
-            self.nineteen_limit_schismas_up = 0
-        elif self.nineteen_limit_schismas_down > self.nineteen_limit_schismas_up:
-            self.nineteen_limit_schismas_down -= self.nineteen_limit_schismas_up
-            self.nineteen_limit_schismas_up = 0
-            string = rf"\{int_to_word[str(self.nineteen_limit_schismas_down)]}"
-            string += "-nineteen-limit-schisma-down"
-            accumulated_accidentals.append(string)
-        else:
-            self.nineteen_limit_schismas_up -= self.nineteen_limit_schismas_down
-            self.nineteen_limit_schismas_down = 0
-            string = rf"\{int_to_word[str(self.nineteen_limit_schismas_up)]}"
-            string += "-nineteen-limit-schisma-up"
-            accumulated_accidentals.append(string)
-        if self.twenty_three_limit_commas_down == self.twenty_three_limit_commas_up:
-            self.twenty_three_limit_commas_down = 0
-            self.twenty_three_limit_commas_up = 0
-        elif self.twenty_three_limit_commas_down > self.twenty_three_limit_commas_up:
-            self.twenty_three_limit_commas_down -= self.twenty_three_limit_commas_up
-            self.twenty_three_limit_commas_up = 0
-            string = rf"\{int_to_word[str(self.twenty_three_limit_commas_down)]}"
-            string += "-twenty-three-limit-comma-down"
-            accumulated_accidentals.append(string)
-        else:
-            self.twenty_three_limit_commas_up -= self.twenty_three_limit_commas_down
-            self.twenty_three_limit_commas_down = 0
-            string = rf"\{int_to_word[str(self.twenty_three_limit_commas_up)]}"
-            string += "-twenty-three-limit-comma-up"
-            accumulated_accidentals.append(string)
-        if self.twenty_nine_limit_commas_down == self.twenty_nine_limit_commas_up:
-            self.twenty_nine_limit_commas_down = 0
-            self.twenty_nine_limit_commas_up = 0
-        elif self.twenty_nine_limit_commas_down > self.twenty_nine_limit_commas_up:
-            self.twenty_nine_limit_commas_down -= self.twenty_nine_limit_commas_up
-            self.twenty_nine_limit_commas_up = 0
-            string = rf"\{int_to_word[str(self.twenty_nine_limit_commas_down)]}"
-            string += "-twenty-nine-limit-comma-down"
-            accumulated_accidentals.append(string)
-        else:
-            self.twenty_nine_limit_commas_up -= self.twenty_nine_limit_commas_down
-            self.twenty_nine_limit_commas_down = 0
-            string = rf"\{int_to_word[str(self.twenty_nine_limit_commas_up)]}"
-            string += "-twenty-nine-limit-comma-up"
-            accumulated_accidentals.append(string)
-        if self.thirty_one_limit_schismas_down == self.thirty_one_limit_schismas_up:
-            self.thirty_one_limit_schismas_down = 0
-            self.thirty_one_limit_schismas_up = 0
-        elif self.thirty_one_limit_schismas_down > self.thirty_one_limit_schismas_up:
-            self.thirty_one_limit_schismas_down -= self.thirty_one_limit_schismas_up
-            self.thirty_one_limit_schismas_up = 0
-            string = rf"\{int_to_word[str(self.thirty_one_limit_schismas_down)]}"
-            string += "-thirty-one-limit-schisma-down"
-            accumulated_accidentals.append(string)
-        else:
-            self.thirty_one_limit_schismas_up -= self.thirty_one_limit_schismas_down
-            self.thirty_one_limit_schismas_down = 0
-            string = rf"\{int_to_word[str(self.thirty_one_limit_schismas_up)]}"
-            string += "-thirty-one-limit-schisma-up"
-            accumulated_accidentals.append(string)
-        if (
-            self.thirty_seven_limit_quarter_tones_down
-            == self.thirty_seven_limit_quarter_tones_up
-        ):
-            self.thirty_seven_limit_quarter_tones_down = 0
-            self.thirty_seven_limit_quarter_tones_up = 0
-        elif (
-            self.thirty_seven_limit_quarter_tones_down
-            > self.thirty_seven_limit_quarter_tones_up
-        ):
-            self.thirty_seven_limit_quarter_tones_down -= (
-                self.thirty_seven_limit_quarter_tones_up
-            )
-            self.thirty_seven_limit_quarter_tones_up = 0
-            string = rf"\{int_to_word[str(self.thirty_seven_limit_quarter_tones_down)]}"
-            string += "-thirty-seven-limit-quarter-tone-down"
-            accumulated_accidentals.append(string)
-        else:
-            self.thirty_seven_limit_quarter_tones_up -= (
-                self.thirty_seven_limit_quarter_tones_down
-            )
-            self.thirty_seven_limit_quarter_tones_down = 0
-            string = rf"\{int_to_word[str(self.thirty_seven_limit_quarter_tones_up)]}"
-            string += "-thirty-seven-limit-quarter-tone-up"
-            accumulated_accidentals.append(string)
-        if self.forty_one_limit_commas_down == self.forty_one_limit_commas_up:
-            self.forty_one_limit_commas_down = 0
-            self.forty_one_limit_commas_up = 0
-        elif self.forty_one_limit_commas_down > self.forty_one_limit_commas_up:
-            self.forty_one_limit_commas_down -= self.forty_one_limit_commas_up
-            self.forty_one_limit_commas_up = 0
-            string = rf"\{int_to_word[str(self.forty_one_limit_commas_down)]}"
-            string += "-forty-one-limit-comma-down"
-            accumulated_accidentals.append(string)
-        else:
-            self.forty_one_limit_commas_up -= self.forty_one_limit_commas_down
-            self.forty_one_limit_commas_down = 0
-            string = rf"\{int_to_word[str(self.forty_one_limit_commas_up)]}"
-            string += "-forty-one-limit-comma-up"
-            accumulated_accidentals.append(string)
-        if self.forty_three_limit_commas_down == self.forty_three_limit_commas_up:
-            self.forty_three_limit_commas_down = 0
-            self.forty_three_limit_commas_up = 0
-        elif self.forty_three_limit_commas_down > self.forty_three_limit_commas_up:
-            self.forty_three_limit_commas_down -= self.forty_three_limit_commas_up
-            self.forty_three_limit_commas_up = 0
-            string = rf"\{int_to_word[str(self.forty_three_limit_commas_down)]}"
-            string += "-forty-three-limit-comma-down"
-            accumulated_accidentals.append(string)
-        else:
-            self.forty_three_limit_commas_up -= self.forty_three_limit_commas_down
-            self.forty_three_limit_commas_down = 0
-            string = rf"\{int_to_word[str(self.forty_three_limit_commas_up)]}"
-            string += "-forty-three-limit-comma-up"
-            accumulated_accidentals.append(string)
-
-        if (
-            self.forty_seven_limit_quarter_tones_down
-            == self.forty_seven_limit_quarter_tones_up
-        ):
-            self.forty_seven_limit_quarter_tones_down = 0
-            self.forty_seven_limit_quarter_tones_up = 0
-        elif (
-            self.forty_seven_limit_quarter_tones_down
-            > self.forty_seven_limit_quarter_tones_up
-        ):
-            self.forty_seven_limit_quarter_tones_down -= (
-                self.forty_seven_limit_quarter_tones_up
-            )
-            self.forty_seven_limit_quarter_tones_up = 0
-            string = rf"\{int_to_word[str(self.forty_seven_limit_quarter_tones_down)]}"
-            string += "-forty-seven-limit-quarter-tone-down"
-            accumulated_accidentals.append(string)
-        else:
-            self.forty_seven_limit_quarter_tones_up -= (
-                self.forty_seven_limit_quarter_tones_down
-            )
-            self.forty_seven_limit_quarter_tones_down = 0
-            string = rf"\{int_to_word[str(self.forty_seven_limit_quarter_tones_up)]}"
-            string += "-forty-seven-limit-quarter-tone-up"
-            accumulated_accidentals.append(string)
-
-        if len(accumulated_accidentals):
-            accumulated_accidentals.reverse()
-            if accumulated_accidentals[-1] == r"\natural":
-                if self.has_just_accidentals():
-                    accumulated_accidentals = [_ for _ in accumulated_accidentals[:-1]]
-            for i, s in enumerate(accumulated_accidentals):
-                if s == r"\natural":
-                    accumulated_accidentals[i] = r"\abjad-natural"
-                if s == r"\sharp":
-                    accumulated_accidentals[i] = r"\abjad-sharp"
-                if s == r"\flat":
-                    accumulated_accidentals[i] = r"\abjad-flat"
-            literal_components = []
-            for accidental_string in accumulated_accidentals:
-                accidental_string = accidental_string + " "
-                literal_components.append(accidental_string)
-            if len(literal_components) == 1:
-                literal = abjad.Markup(rf"\markup {{ {literal_components[0]} }}")
-            else:
-                kerned_components = []
-                for i, item in enumerate(literal_components):
-                    kerned_components.append(item)
-                    if i != len(literal_components) - 1:
-                        kerned_components.append(r"\hspace #0.125 ")
-                kerned_components_string = ""
-                for kerned_component in kerned_components:
-                    kerned_components_string += kerned_component
-                literal = abjad.Markup(
-                    rf"\markup \concat {{ {kerned_components_string} }}"
-                )
-        else:
-            literal = abjad.Markup(rf" \markup {{ \abjad-{self.diatonic_accidental} }}")
-        self.accidental_literal = literal
-        return literal
+        key = (self._diatonic_accidental, self._monzo)
+        markup = _vector_key_to_markup.get(key)
+        if markup is None:
+            markup = _make_ji_markup(self._diatonic_accidental, self._monzo)
+            _vector_key_to_markup[key] = markup
+        return markup
 
 
 class JIBundle:
@@ -435,13 +503,47 @@ class JIBundle:
         "c'"
 
         >>> bundle.vector
-        repr not yet defined
+        JIVector()
 
     """
 
-    def __init__(self, pitch="c'", vector=JIVector()):
-        self.pitch = pitch
-        self.vector = vector
+    __slots__ = ("_hash", "_pitch", "_vector")
+
+    def __init__(self, pitch="c'", vector=None):
+        if vector is None:
+            vector = JIVector()
+        object.__setattr__(self, "_pitch", pitch)
+        object.__setattr__(self, "_vector", vector)
+        object.__setattr__(self, "_hash", None)
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is read-only.")
+
+    def __eq__(self, argument):
+        """
+        Is true when ``argument`` is a bundle with equal pitch and vector.
+
+        ..  container:: example
+
+            >>> microtones.JIBundle() == microtones.JIBundle()
+            True
+
+        """
+        if not isinstance(argument, type(self)):
+            return False
+        return self._pitch == argument._pitch and self._vector == argument._vector
+
+    def __hash__(self):
+        """
+        Hashes bundle.
+        """
+        if self._hash is None:
+            value = hash((type(self), self._pitch, self._vector))
+            object.__setattr__(self, "_hash", value)
+        return self._hash
+
+    def __reduce__(self):
+        return type(self), (self._pitch, self._vector)
 
     def __repr__(self):
         """
@@ -450,46 +552,41 @@ class JIBundle:
         ..  container:: example
 
             >>> microtones.JIBundle()
-            repr not yet defined
+            JIBundle(pitch="c'", vector=JIVector())
 
         """
-        return "repr not yet defined"
-
-    def __str__(self):
-        string = str(self)
-        string = black.format_str(string, mode=black.mode.Mode())
-        return string
-
-
-def _is_prime(n):
-    if n == 1:
-        return False
-    if n % 2 == 0:
-        return False
-    i = 3
-    while i * i <= n:
-        if n % i == 0:
-            return False
-        i += 2
-    return True
-
-
-def _prime_factors(n):
-    prime_factor_list = []
-    while not n % 2:
-        prime_factor_list.append(2)
-        n //= 2
-    while not n % 3:
-        prime_factor_list.append(3)
-        n //= 3
-    i = 5
-    while n != 1:
-        if _is_prime(i):
-            while not n % i:
-                prime_factor_list.append(i)
-                n //= i
-        i += 2
-    return prime_factor_list
+        name = type(self).__name__
+        return f"{name}(pitch={self._pitch!r}, vector={self._vector!r})"
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only.")
+
+    @property
+    def pitch(self):
+        """
+        Gets pitch.
+
+        ..  container:: example
+
+            >>> microtones.JIBundle("g'").pitch
+            "g'"
+
+        """
+        return self._pitch
+
+    @property
+    def vector(self):
+        """
+        Gets vector.
+
+        ..  container:: example
+
+            >>> vector = microtones.JIVector(syntonic_commas_down=1)
+            >>> microtones.JIBundle("e'", vector).vector
+            JIVector(syntonic_commas_down=1)
+
+        """
+        return self._vector
 
 
 _numerator_factor_to_intervals = {
@@ -510,23 +607,122 @@ _numerator_factor_to_intervals = {
     47: ("+P8", "+P8", "+P8", "+P8", "+P8", "+A4"),
 }
 
-_numerator_factor_to_nudge = {
-    5: "syntonic_commas_down",
-    7: "septimal_commas_down",
-    11: "undecimal_quarter_tones_up",
-    13: "tridecimal_third_tones_down",
-    17: "seventeen_limit_schismas_down",
-    19: "nineteen_limit_schismas_up",
-    23: "twenty_three_limit_commas_up",
-    29: "twenty_nine_limit_commas_up",
-    31: "thirty_one_limit_schismas_down",
-    37: "thirty_seven_limit_quarter_tones_up",
-    41: "forty_one_limit_commas_up",
-    43: "forty_three_limit_commas_up",
-    47: "forty_seven_limit_quarter_tones_up",
+
+_smooth_primes = (2, 3) + _primes
+
+
+def _make_prime_to_displacement():
+    table = {}
+    for prime, strings in _numerator_factor_to_intervals.items():
+        intervals = [abjad.NamedInterval(_) for _ in strings]
+        staff_spaces = sum(_.staff_spaces for _ in intervals)
+        semitones = sum(_.semitones for _ in intervals)
+        table[prime] = (staff_spaces, semitones)
+    return table
+
+
+# prime -> (staff spaces, semitones) spanned by the prime's intervals
+_prime_to_displacement = _make_prime_to_displacement()
+
+_diatonic_pc_names = "cdefgab"
+
+_diatonic_pc_name_to_pitch_class_number = {
+    "c": 0,
+    "d": 2,
+    "e": 4,
+    "f": 5,
+    "g": 7,
+    "a": 9,
+    "b": 11,
 }
 
 
+def _transpose_by_exponents(pitch, exponents):
+    staff_spaces, semitones = 0, 0
+    for prime, exponent in zip(_smooth_primes, exponents):
+        if exponent:
+            displacement = _prime_to_displacement[prime]
+            staff_spaces += exponent * displacement[0]
+            semitones += exponent * displacement[1]
+    number = pitch.number + semitones
+    if not isinstance(pitch, abjad.NamedPitch):
+        return type(pitch)(number)
+    # same spelling arithmetic as abjad.NamedPitch.transpose()
+    index = _diatonic_pc_names.index(pitch.name[0]) + staff_spaces
+    diatonic_pc_name = _diatonic_pc_names[index % 7]
+    pitch_class_number = _diatonic_pc_name_to_pitch_class_number[diatonic_pc_name]
+    down = (number - pitch_class_number) % 12
+    up = (pitch_class_number - number) % 12
+    if up < down:
+        natural_number = number + up
+    else:
+        natural_number = number - down
+    accidental = abjad.Accidental(number - natural_number)
+    octave = abjad.Octave(int(math.floor(natural_number / 12)) + 4)
+    return abjad.NamedPitch(diatonic_pc_name + str(accidental) + octave.ticks)
+
+
+def factor_ratio(ratio):
+    """
+    Factors 47-smooth ``ratio`` into signed exponents of primes 2 through 47.
+
+    ..  container:: example
+
+        >>> microtones.factor_ratio("45/32")
+        (-5, 2, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+
+    ..  container:: example
+
+        Raises value error when ``ratio`` has a prime factor greater than 47:
+
+        >>> microtones.factor_ratio("53/32")
+        Traceback (most recent call last):
+            ...
+        ValueError: 53 has prime factors greater than 47.
+
+    """
+    ratio = quicktions.Fraction(ratio)
+    if ratio <= 0:
+        raise ValueError(f"ratio must be positive: {ratio!r}.")
+    exponents = [0] * len(_smooth_primes)
+    _factor_integer(ratio.numerator, _smooth_primes, exponents, 1)
+    _factor_integer(ratio.denominator, _smooth_primes, exponents, -1)
+    return tuple(exponents)
+
+
+def factor_ratios(ratios):
+    """
+    Factors each of ``ratios``.
+
+    Factors each distinct ratio once.
+
+    ..  container:: example
+
+        >>> for exponents in microtones.factor_ratios(range(1, 9)):
+        ...     exponents[:4]
+        ...
+        (0, 0, 0, 0)
+        (1, 0, 0, 0)
+        (0, 1, 0, 0)
+        (2, 0, 0, 0)
+        (0, 0, 1, 0)
+        (1, 1, 0, 0)
+        (0, 0, 0, 1)
+        (3, 0, 0, 0)
+
+    """
+    ratio_to_exponents = {}
+    result = []
+    for ratio in ratios:
+        ratio = quicktions.Fraction(ratio)
+        exponents = ratio_to_exponents.get(ratio)
+        if exponents is None:
+            exponents = factor_ratio(ratio)
+            ratio_to_exponents[ratio] = exponents
+        result.append(exponents)
+    return result
+
+
 def make_ji_bundle(pitch, ratio):
     r"""
     Makes JI bundle.
@@ -538,75 +734,183 @@ def make_ji_bundle(pitch, ratio):
         NamedPitch("g'")
 
         >>> bundle.vector
-        repr not yet defined
+        JIVector()
 
     """
     if isinstance(pitch, str):
         pitch = abjad.NamedPitch(pitch)
     elif isinstance(pitch, int):
         pitch = abjad.NumberedPitch(pitch)
-    ratio = quicktions.Fraction(ratio)
-    numerator_factors = _prime_factors(ratio.numerator)
-    denominator_factors = _prime_factors(ratio.denominator)
-    accidental_vector = JIVector(diatonic_accidental=pitch.accidental.name)
-    for prime in numerator_factors:
-        assert prime <= 47
-        for string in _numerator_factor_to_intervals[prime]:
-            pitch = abjad.NamedInterval(string).transpose(pitch)
-        if prime in _numerator_factor_to_nudge:
-            string = _numerator_factor_to_nudge[prime]
-            value = getattr(accidental_vector, string)
-            setattr(accidental_vector, string, value + 1)
-    for prime in denominator_factors:
-        assert prime <= 47
-        for string in _numerator_factor_to_intervals[prime]:
-            string = string.replace("+", "-")
-            pitch = abjad.NamedInterval(string).transpose(pitch)
-        if prime in _numerator_factor_to_nudge:
-            string = _numerator_factor_to_nudge[prime]
-            if string.endswith("_up"):
-                string = string.replace("_up", "_down")
-            else:
-                string = string.replace("_down", "_up")
-            value = getattr(accidental_vector, string)
-            setattr(accidental_vector, string, value + 1)
-    accidental_vector.diatonic_accidental = pitch.accidental.name
+    exponents = factor_ratio(ratio)
+    pitch = _transpose_by_exponents(pitch, exponents)
+    accidental_vector = JIVector.from_monzo(exponents[2:], pitch.accidental.name)
     return JIBundle(pitch, accidental_vector)
 
 
-def return_cent_deviation_markup(
-    ratio=1, fundamental="a'", chris=False
-):  # chris values are temp.
-    pitch = None
-    ratio = quicktions.Fraction(ratio)
-    tonic_cent_difference = abjad.NamedPitch(fundamental).number * 100
-    log_ratio = quicktions.Fraction(math.log10(ratio))
-    log_2 = quicktions.Fraction(1200 / math.log10(2))
-    ji_cents = quicktions.Fraction(log_ratio * log_2)
-    et_cents = (
-        make_ji_bundle(fundamental, ratio).pitch.number * 100
-    ) - tonic_cent_difference
-    cent_difference = ji_cents - et_cents
-    final_cents = round(float(cent_difference))
-    if chris is True:
-        final_cents = round(float(cent_difference), 2)
+tuning_cache = LRUCache(maxsize=1024)
+
+_accidental_stencil_tweak = abjad.Tweak(
+    r"\tweak Accidental.stencil #ly:text-interface::print"
+)
+
+
+def ratio_to_cents(ratio):
+    """
+    Converts ``ratio`` to cents.
+
+    ..  container:: example
+
+        >>> round(microtones.ratio_to_cents("3/2"), 3)
+        701.955
+
+        >>> microtones.ratio_to_cents(4)
+        2400.0
+
+    """
+    if isinstance(ratio, str):
+        ratio = quicktions.Fraction(ratio)
+    if isinstance(ratio, numbers.Rational):
+        # logs of the terms keep precision for very large ratios
+        return 1200 * (math.log2(ratio.numerator) - math.log2(ratio.denominator))
+    return 1200 * math.log2(ratio)
+
+
+def _get_semitones(exponents):
+    semitones = 0
+    for prime, exponent in zip(_smooth_primes, exponents):
+        if exponent:
+            semitones += exponent * _prime_to_displacement[prime][1]
+    return semitones
+
+
+def cents_deviation(ratio):
+    """
+    Gets cents from the tempered pitch notated by ``make_ji_bundle()`` to
+    ``ratio``.
+
+    ..  container:: example
+
+        >>> round(microtones.cents_deviation("5/4"), 2)
+        -13.69
+
+        >>> round(microtones.cents_deviation("7/4"), 2)
+        -31.17
+
+    """
+    exponents = factor_ratio(ratio)
+    return ratio_to_cents(ratio) - 100 * _get_semitones(exponents)
+
+
+def ratios_to_cents_arrays(ratios, denominators=None, *, fundamental=0):
+    """
+    Gets NumPy arrays of cents, nearest 12-ET pitch numbers and signed cents
+    deviations for ``ratios``.
+
+    ``ratios`` is either a sequence of ratios or, when ``denominators`` is
+    set, an array of integer numerators. Pitch numbers are relative to
+    ``fundamental``, given as a pitch or pitch number. Requires NumPy.
+
+    ..  container:: example
+
+        >>> cents, pitches, deviations = microtones.ratios_to_cents_arrays(
+        ...     [1, 2, 3, 4, 5, 6, 7], fundamental="a,,,"
+        ... )
+        >>> cents.round(2).tolist()
+        [0.0, 1200.0, 1901.96, 2400.0, 2786.31, 3101.96, 3368.83]
+
+        >>> pitches.tolist()
+        [-39, -27, -20, -15, -11, -8, -5]
+
+        >>> deviations.round(2).tolist()
+        [0.0, 0.0, 1.96, 0.0, -13.69, 1.96, -31.17]
+
+    ..  container:: example
+
+        Reads numerators and denominators from integer arrays:
+
+        >>> import numpy
+        >>> numerators = numpy.arange(8, 16)
+        >>> cents, pitches, deviations = microtones.ratios_to_cents_arrays(
+        ...     numerators, numpy.full(8, 8)
+        ... )
+        >>> pitches.tolist()
+        [0, 2, 4, 6, 7, 8, 10, 11]
+
+    """
+    try:
+        import numpy
+    except ImportError as exception:  # pragma: no cover
+        message = "ratios_to_cents_arrays() requires NumPy."
+        raise ImportError(message) from exception
+    if denominators is None:
+        fractions = [quicktions.Fraction(_) for _ in ratios]
+        numerators = numpy.array([_.numerator for _ in fractions], dtype=float)
+        denominators = numpy.array([_.denominator for _ in fractions], dtype=float)
+    else:
+        numerators = numpy.asarray(ratios, dtype=float)
+        denominators = numpy.asarray(denominators, dtype=float)
+    if not isinstance(fundamental, numbers.Number):
+        fundamental = abjad.NamedPitch(fundamental).number
+    cents = 1200 * (numpy.log2(numerators) - numpy.log2(denominators))
+    steps = numpy.rint(cents / 100)
+    deviations = cents - 100 * steps
+    pitches = steps.astype(int) + fundamental
+    return cents, pitches, deviations
+
+
+_cent_deviation_markups = LRUCache(maxsize=1024)
+
+
+def return_cent_deviation_markup(ratio=1, fundamental="a'", chris=False):
+    r"""
+    Makes cents deviation markup for ``ratio`` over ``fundamental``.
+
+    Prefixes the tempered pitch-class name when the deviation exceeds 50
+    cents, or always when ``chris=True``. Markups are memoized per ratio,
+    fundamental and ``chris``.
+
+    ..  container:: example
+
+        >>> markup = microtones.return_cent_deviation_markup("5/4")
+        >>> print(abjad.lilypond(markup))
+        \markup \center-align { \concat { -14 } }
+
+        >>> markup = microtones.return_cent_deviation_markup("7/4", chris=True)
+        >>> print(abjad.lilypond(markup))
+        \markup \center-align { \concat { G-31.17 } }
+
+        Only ``True`` selects this format:
+
+        >>> markup = microtones.return_cent_deviation_markup("7/4", chris=1)
+        >>> print(abjad.lilypond(markup))
+        \markup \center-align { \concat { -31 } }
+
+    """
+    if not isinstance(ratio, numbers.Rational):
+        ratio = quicktions.Fraction(ratio)
+    # 1 == True, so normalize before keying
+    chris = chris is True
+    key = (ratio, fundamental, chris)
+    markup = _cent_deviation_markups.get(key)
+    if markup is None:
+        markup = _make_cent_deviation_markup(ratio, fundamental, chris)
+        _cent_deviation_markups[key] = markup
+    return markup
+
+
+def _make_cent_deviation_markup(ratio, fundamental, chris):
+    exponents = factor_ratio(ratio)
+    semitones = _get_semitones(exponents)
+    cent_difference = ratio_to_cents(ratio) - 100 * semitones
     if chris is True:
-        p_string = f"{fundamental.name}4"
-        demo_note = abjad.Note(p_string)
-        demo_head = demo_note.note_head
-        # tune_to_ratio(demo_head, quicktions.Fraction(ratio) * quicktions.Fraction(9, 8)) # for Rag'sma only
-        tune_to_ratio(demo_head, quicktions.Fraction(ratio))
-        pitch = abjad.NumberedPitch(demo_head.written_pitch)
+        final_cents = round(cent_difference, 2)
+    else:
+        final_cents = round(cent_difference)
+    pitch = None
+    if chris is True or 50 < abs(final_cents):
+        pitch = abjad.NamedPitch(fundamental).number + semitones
     if 50 < abs(final_cents):
-        if chris is False:
-            p_string = f"{fundamental.name}4"
-            # raise Exception(p_string)
-            demo_note = abjad.Note(p_string)
-            demo_head = demo_note.note_head
-            tune_to_ratio(demo_head, ratio)
-            pitch = abjad.NumberedPitch(demo_head.written_pitch)
-        semitones = final_cents / 100
-        parts = math.modf(semitones)
+        parts = math.modf(final_cents / 100)
         pitch += parts[1]
         remainder = round(parts[0] * 100)
         if 50 < abs(remainder):
@@ -619,70 +923,24 @@ def return_cent_deviation_markup(
         final_cents = remainder
     if final_cents < 0:
         cent_string = f"{final_cents}"
-        if chris is True:
-            if not cent_string[0].isalpha():
-                pitch_string = str(abjad.NamedPitchClass(pitch).name)
-                pos, acc = pitch_string[0], pitch_string[1:]
-                pos = pos.capitalize()
-                acc = acc.replace(
-                    "s",
-                    r"\raise #0.75 { \teeny \smaller \sharp } ",
-                )
-                acc = acc.replace(
-                    "f", r"\raise #0.5 { \teeny \flat } "
-                )
-                cent_string = pos + acc + cent_string
-                cent_string = cent_string.replace(
-                    r"A\raise #0.5 { \teeny \flat } ",
-                    r"G\raise #0.75 { \teeny \smaller \sharp } ",
-                )
-        if chris is False:
-            if pitch is not None:
-                pitch_string = str(abjad.NamedPitchClass(pitch).name)
-                pos, acc = pitch_string[0], pitch_string[1:]
-                pos = pos.capitalize()
-                acc = acc.replace(
-                    "s",
-                    r"\raise #0.75 { \teeny \smaller \sharp } ",
-                )
-                acc = acc.replace(
-                    "f", r"\raise #0.5 { \teeny \flat } "
-                )
-                cent_string = pos + acc + cent_string
     else:
         cent_string = f"+{final_cents}"
+    if pitch is not None:
+        pitch_string = str(abjad.NamedPitchClass(pitch).name)
+        pos, acc = pitch_string[0], pitch_string[1:]
+        pos = pos.capitalize()
+        acc = acc.replace(
+            "s",
+            r"\raise #0.75 { \teeny \smaller \sharp } ",
+        )
+        acc = acc.replace("f", r"\raise #0.5 { \teeny \flat } ")
+        cent_string = pos + acc + cent_string
         if chris is True:
-            if not cent_string[0].isalpha():
-                pitch_string = str(abjad.NamedPitchClass(pitch).name)
-                pos, acc = pitch_string[0], pitch_string[1:]
-                pos = pos.capitalize()
-                acc = acc.replace(
-                    "s",
-                    r"\raise #0.75 { \teeny \smaller \sharp } ",
-                )
-                acc = acc.replace(
-                    "f", r"\raise #0.5 { \teeny \flat } "
-                )
-                cent_string = pos + acc + cent_string
-                cent_string = cent_string.replace(
-                    r"A\raise #0.5 { \teeny \flat } ",
-                    r"G\raise #0.75 { \teeny \smaller \sharp } ",
-                )
-        if chris is False:
-            if pitch is not None:
-                pitch_string = str(abjad.NamedPitchClass(pitch).name)
-                pos, acc = pitch_string[0], pitch_string[1:]
-                pos = pos.capitalize()
-                acc = acc.replace(
-                    "s",
-                    r"\raise #0.75 { \teeny \smaller \sharp } ",
-                )
-                acc = acc.replace(
-                    "f", r"\raise #0.5 { \teeny \flat } "
-                )
-                cent_string = pos + acc + cent_string
-    mark = abjad.Markup(rf"\markup \center-align {{ \concat {{ {cent_string} }} }}")
-    return mark
+            cent_string = cent_string.replace(
+                r"A\raise #0.5 { \teeny \flat } ",
+                r"G\raise #0.75 { \teeny \smaller \sharp } ",
+            )
+    return abjad.Markup(rf"\markup \center-align {{ \concat {{ {cent_string} }} }}")
 
 
 def tune_to_ratio(
@@ -928,26 +1186,214 @@ def tune_to_ratio(
             \tweak Accidental.text \tempered-natural
             e'''4
 
+    ..  container:: example
+
+        Tunings are memoized in ``tuning_cache`` by pitch, ratio and
+        ``tempered``:
+
+        >>> microtones.tuning_cache.clear()
+        >>> notes = [abjad.Note("c'4") for _ in range(3)]
+        >>> for note in notes:
+        ...     microtones.tune_to_ratio(note.note_head, "7/4")
+        ...
+        >>> microtones.tuning_cache
+        LRUCache(hits=2, misses=1, maxsize=1024, currsize=1)
+
+        >>> print(abjad.lilypond(notes[-1]))
+        \tweak Accidental.stencil #ly:text-interface::print
+        \tweak Accidental.text \markup \concat { \one-septimal-comma-down \hspace #0.125 \abjad-flat  }
+        bf'4
+
     """
-    bundle = make_ji_bundle(note_head.written_pitch, ratio)
-    note_head.written_pitch = bundle.pitch
+    pitch, tweaks = _get_tuning(note_head.written_pitch, ratio, tempered)
+    note_head.written_pitch = pitch
     if omit_just_accidental:
         return
-    if tempered is True:
-        tempered_accidental = note_head.written_pitch.accidental.name
-        tempered_accidental = tempered_accidental.replace(" ", "-")
-        # manager = abjad.tweak(note_head, literal=True)
-        # manager.Accidental.stencil = r"#ly:text-interface::print"
-        abjad.tweak(note_head, r"\tweak Accidental.stencil #ly:text-interface::print")
-        # manager.Accidental.text = rf"\tempered-{tempered_accidental}"
-        abjad.tweak(
-            note_head, rf"\tweak Accidental.text \tempered-{tempered_accidental}"
-        )
+    abjad.tweak(note_head, *tweaks)
+
+
+def _get_tuning(pitch, ratio, tempered):
+    if not isinstance(ratio, numbers.Rational):
+        ratio = quicktions.Fraction(ratio)
+    key = (type(pitch), pitch, ratio, tempered)
+    tuning = tuning_cache.get(key)
+    if tuning is None:
+        bundle = make_ji_bundle(pitch, ratio)
+        if tempered is True:
+            tempered_accidental = bundle.pitch.accidental.name.replace(" ", "-")
+            string = rf"\tempered-{tempered_accidental}"
+        else:
+            string = bundle.vector.calculate_ji_markup().string
+        tweak = abjad.Tweak(rf"\tweak Accidental.text {string}")
+        tuning = (bundle.pitch, (_accidental_stencil_tweak, tweak))
+        tuning_cache[key] = tuning
+    return tuning
+
+
+def tune_to_ratios(
+    argument,
+    ratios,
+    *,
+    fundamental=None,
+    omit_just_accidental=False,
+    tempered=False,
+):
+    r"""
+    Tunes every note head in ``argument`` in place.
+
+    ``argument`` may contain notes, chords, note heads and logical ties.
+    ``ratios`` is either a sequence paired in order with the items of
+    ``argument`` or a mapping from pitch or pitch class to ratio. In a
+    sequence, an item's ratio may itself be a list or tuple with one ratio per
+    note head of a chord; otherwise every note head of the item receives the
+    same ratio. Note heads absent from a mapping and items without note heads
+    are skipped.
+
+    Tunes each note head relative to its own written pitch, or relative to
+    ``fundamental`` when ``fundamental`` is set.
+
+    Each distinct pitch and ratio is tuned only once per call.
+
+    ..  container:: example
+
+        >>> staff = abjad.Staff("c'4 ~ c'4 r4 <c' g'>4")
+        >>> logical_ties = abjad.select.logical_ties(staff)
+        >>> microtones.tune_to_ratios(logical_ties, ["5/4", 1, "7/4"])
+        >>> print(abjad.lilypond(staff))
+        \new Staff
+        {
+            \tweak Accidental.stencil #ly:text-interface::print
+            \tweak Accidental.text \markup { \natural-one-syntonic-comma-down  }
+            e'4
+            ~
+            \tweak Accidental.stencil #ly:text-interface::print
+            \tweak Accidental.text \markup { \natural-one-syntonic-comma-down  }
+            e'4
+            r4
+            <
+                \tweak Accidental.stencil #ly:text-interface::print
+                \tweak Accidental.text \markup \concat { \one-septimal-comma-down \hspace #0.125 \abjad-flat  }
+                bf'
+                \tweak Accidental.stencil #ly:text-interface::print
+                \tweak Accidental.text \markup { \one-septimal-comma-down  }
+                f''
+            >4
+        }
+
+    ..  container:: example
+
+        Tunes chords over a fundamental with one ratio per note head:
+
+        >>> chord = abjad.Chord("<c c c c c c>1")
+        >>> microtones.tune_to_ratios(
+        ...     [chord], [(4, 5, 6, 7, 9, 11)], fundamental="c,,", tempered=True
+        ... )
+        >>> print(abjad.lilypond(chord))
+        <
+            \tweak Accidental.stencil #ly:text-interface::print
+            \tweak Accidental.text \tempered-natural
+            c
+            \tweak Accidental.stencil #ly:text-interface::print
+            \tweak Accidental.text \tempered-natural
+            e
+            \tweak Accidental.stencil #ly:text-interface::print
+            \tweak Accidental.text \tempered-natural
+            g
+            \tweak Accidental.stencil #ly:text-interface::print
+            \tweak Accidental.text \tempered-flat
+            bf
+            \tweak Accidental.stencil #ly:text-interface::print
+            \tweak Accidental.text \tempered-natural
+            d'
+            \tweak Accidental.stencil #ly:text-interface::print
+            \tweak Accidental.text \tempered-natural
+            f'
+        >1
+
+    ..  container:: example
+
+        Looks up note heads by pitch and then by pitch class when ``ratios``
+        is a mapping:
+
+        >>> staff = abjad.Staff("c'4 d'4 c''4")
+        >>> ratios = {
+        ...     abjad.NamedPitch("c''"): "3/2",
+        ...     abjad.NamedPitchClass("c"): "5/4",
+        ... }
+        >>> microtones.tune_to_ratios(staff, ratios, omit_just_accidental=True)
+        >>> print(abjad.lilypond(staff))
+        \new Staff
+        {
+            e'4
+            d'4
+            g''4
+        }
+
+    ..  container:: example
+
+        Raises value error when ``ratios`` and ``argument`` differ in length:
+
+        >>> staff = abjad.Staff("c'4 d'4")
+        >>> microtones.tune_to_ratios(staff, ["5/4"])
+        Traceback (most recent call last):
+            ...
+        ValueError: 1 ratios for 2 items.
+
+    """
+    if fundamental is not None and not isinstance(fundamental, abjad.Pitch):
+        fundamental = abjad.NamedPitch(fundamental)
+    pairs = []
+    if isinstance(ratios, collections.abc.Mapping):
+        for item in argument:
+            for note_heads in _iterate_note_head_groups(item):
+                for note_head in note_heads:
+                    pitch = note_head.written_pitch
+                    ratio = ratios.get(pitch)
+                    if ratio is None:
+                        ratio = ratios.get(pitch.pitch_class)
+                    if ratio is not None:
+                        pairs.append((note_head, ratio))
     else:
-        markup = bundle.vector.calculate_ji_markup()
-        # manager = abjad.tweak(note_head, literal=True)
-        # manager.Accidental.stencil = r"#ly:text-interface::print"
-        abjad.tweak(note_head, r"\tweak Accidental.stencil #ly:text-interface::print")
-        alteration_literal = markup
-        # manager.Accidental.text = alteration_literal
-        abjad.tweak(note_head, rf"\tweak Accidental.text {alteration_literal.string}")
+        argument, ratios = list(argument), list(ratios)
+        if len(argument) != len(ratios):
+            raise ValueError(f"{len(ratios)} ratios for {len(argument)} items.")
+        for item, ratio in zip(argument, ratios):
+            for note_heads in _iterate_note_head_groups(item):
+                if isinstance(ratio, (list, tuple)):
+                    if len(ratio) != len(note_heads):
+                        message = (
+                            f"{len(ratio)} ratios for {len(note_heads)} note heads."
+                        )
+                        raise ValueError(message)
+                    pairs.extend(zip(note_heads, ratio))
+                else:
+                    pairs.extend((_, ratio) for _ in note_heads)
+    key_to_tuning = {}
+    tunings = []
+    for note_head, ratio in pairs:
+        if fundamental is None:
+            pitch = note_head.written_pitch
+        else:
+            pitch = fundamental
+        key = (type(pitch), pitch, ratio)
+        tuning = key_to_tuning.get(key)
+        if tuning is None:
+            tuning = _get_tuning(pitch, ratio, tempered)
+            key_to_tuning[key] = tuning
+        tunings.append(tuning)
+    for (note_head, _), (pitch, tweaks) in zip(pairs, tunings):
+        note_head.written_pitch = pitch
+        if not omit_just_accidental:
+            abjad.tweak(note_head, *tweaks)
+
+
+def _iterate_note_head_groups(item):
+    if isinstance(item, abjad.NoteHead):
+        yield [item]
+    elif isinstance(item, abjad.Note):
+        yield [item.note_head]
+    elif isinstance(item, abjad.Chord):
+        yield list(item.note_heads)
+    elif isinstance(item, abjad.LogicalTie):
+        for leaf in item:
+            yield from _iterate_note_head_groups(leaf)
@@ -0,0 +1,358 @@
+"""
+Package for ratio lattices.
+"""
+import array
+import itertools
+import operator
+
+import quicktions
+
+from .utilities import (
+    RatioClassSet,
+    RatioSet,
+    _factor_integer,
+    _flatten,
+    _get_octave_exponent,
+)
+
+_limit_to_primes: dict = {}
+
+
+def _get_primes(limit):
+    if limit not in _limit_to_primes:
+        is_prime = [True] * (limit + 1)
+        primes = []
+        for n in range(2, limit + 1):
+            if is_prime[n]:
+                primes.append(n)
+                for multiple in range(n * n, limit + 1, n):
+                    is_prime[multiple] = False
+        _limit_to_primes[limit] = tuple(primes)
+    return _limit_to_primes[limit]
+
+
+class RatioLattice:
+    """
+    Ratio lattice.
+
+    Stores each ratio as exponents of primes up to ``limit`` in one contiguous
+    integer array, so multiplication is vector addition, inversion is negation
+    and octave reduction drops or adjusts the exponent of 2. Converts back to
+    fractions only on demand.
+
+    >>> from abjadext import microtones
+
+    ..  container:: example
+
+        >>> lattice = microtones.RatioLattice([1, "5/4", "3/2"], limit=5)
+        >>> lattice
+        RatioLattice(['1', '5/4', '3/2'], limit=5)
+
+        >>> lattice.exponents
+        ((0, 0, 0), (-2, 0, 1), (-1, 1, 0))
+
+        >>> lattice.multiply("3/2").reduce_to_octave()
+        RatioLattice(['3/2', '15/8', '9/8'], limit=5)
+
+    ..  container:: example
+
+        Raises value error when a ratio has a prime factor greater than
+        ``limit``:
+
+        >>> microtones.RatioLattice(["7/4"], limit=5)
+        Traceback (most recent call last):
+            ...
+        ValueError: 7 has prime factors greater than 5.
+
+    """
+
+    __slots__ = ("_array", "_limit", "_primes")
+
+    def __init__(self, ratios=(), limit=47):
+        assert isinstance(limit, int) and 2 <= limit, repr(limit)
+        primes = _get_primes(limit)
+        rows = {}
+        for ratio in _flatten(ratios):
+            ratio = quicktions.Fraction(ratio)
+            if ratio <= 0:
+                raise ValueError(f"ratio must be positive: {ratio!r}.")
+            exponents = [0] * len(primes)
+            _factor_integer(ratio.numerator, primes, exponents, 1)
+            _factor_integer(ratio.denominator, primes, exponents, -1)
+            rows[tuple(exponents)] = None
+        self._limit = limit
+        self._primes = primes
+        self._array = array.array("q", itertools.chain.from_iterable(rows))
+
+    def __eq__(self, argument):
+        """
+        Is true when ``argument`` is a lattice with same limit and same ratios
+        in any order.
+
+        ..  container:: example
+
+            >>> microtones.RatioLattice([3, 5]) == microtones.RatioLattice([5, 3])
+            True
+
+            >>> microtones.RatioLattice([3], limit=5) == microtones.RatioLattice([3])
+            False
+
+        """
+        if not isinstance(argument, type(self)):
+            return False
+        if self._limit != argument._limit:
+            return False
+        return frozenset(self._iterate_rows()) == frozenset(argument._iterate_rows())
+
+    def __getitem__(self, index):
+        """
+        Gets ratio at ``index``.
+
+        ..  container:: example
+
+            >>> microtones.RatioLattice([1, "5/4", "3/2"])[-1]
+            Fraction(3, 2)
+
+        """
+        width = len(self._primes)
+        index = range(len(self))[index]
+        return self._to_fraction(self._array[index * width : (index + 1) * width])
+
+    def __hash__(self):
+        """
+        Hashes lattice.
+        """
+        return hash((type(self), self._limit, frozenset(self._iterate_rows())))
+
+    def __iter__(self):
+        """
+        Iterates ratios.
+
+        ..  container:: example
+
+            >>> for ratio in microtones.RatioLattice(["9/8", "7/4"]):
+            ...     ratio
+            ...
+            Fraction(9, 8)
+            Fraction(7, 4)
+
+        """
+        for row in self._iterate_rows():
+            yield self._to_fraction(row)
+
+    def __len__(self):
+        """
+        Gets number of ratios.
+
+        ..  container:: example
+
+            >>> len(microtones.RatioLattice([1, 2, 2, 3]))
+            3
+
+        """
+        return len(self._array) // len(self._primes)
+
+    def __repr__(self):
+        """
+        Gets interpreter representation.
+        """
+        ratios = [str(_) for _ in self]
+        return f"{type(self).__name__}({ratios!r}, limit={self._limit})"
+
+    def _from_rows(self, rows):
+        # dict keys deduplicate in insertion order
+        lattice = type(self).__new__(type(self))
+        lattice._limit = self._limit
+        lattice._primes = self._primes
+        rows = dict.fromkeys(tuple(_) for _ in rows)
+        lattice._array = array.array("q", itertools.chain.from_iterable(rows))
+        return lattice
+
+    def _from_array(self, array_):
+        lattice = type(self).__new__(type(self))
+        lattice._limit = self._limit
+        lattice._primes = self._primes
+        lattice._array = array_
+        return lattice
+
+    def _get_vector(self, ratio):
+        return type(self)([ratio], self._limit)._array
+
+    def _iterate_rows(self):
+        width = len(self._primes)
+        for i in range(0, len(self._array), width):
+            yield tuple(self._array[i : i + width])
+
+    def _to_fraction(self, row):
+        numerator, denominator = 1, 1
+        for prime, exponent in zip(self._primes, row):
+            if 0 < exponent:
+                numerator *= prime**exponent
+            elif exponent < 0:
+                denominator *= prime**-exponent
+        return quicktions.Fraction(numerator, denominator)
+
+    @property
+    def exponents(self):
+        """
+        Gets exponents of primes for each ratio.
+
+        ..  container:: example
+
+            >>> microtones.RatioLattice(["45/32"], limit=5).exponents
+            ((-5, 2, 1),)
+
+        """
+        return tuple(self._iterate_rows())
+
+    @property
+    def limit(self):
+        """
+        Gets prime limit.
+
+        ..  container:: example
+
+            >>> microtones.RatioLattice().limit
+            47
+
+        """
+        return self._limit
+
+    @property
+    def primes(self):
+        """
+        Gets primes up to limit.
+
+        ..  container:: example
+
+            >>> microtones.RatioLattice(limit=11).primes
+            (2, 3, 5, 7, 11)
+
+        """
+        return self._primes
+
+    @classmethod
+    def from_exponents(class_, exponents, limit=47):
+        """
+        Makes lattice from exponents of primes up to ``limit``.
+
+        ..  container:: example
+
+            >>> microtones.RatioLattice.from_exponents([(-1, 1), (-2, 0, 1)], limit=5)
+            RatioLattice(['3/2', '5/4'], limit=5)
+
+        """
+        lattice = class_(limit=limit)
+        width = len(lattice._primes)
+        rows = []
+        for row in exponents:
+            row = tuple(row)
+            assert len(row) <= width, repr(row)
+            rows.append(row + (0,) * (width - len(row)))
+        return lattice._from_rows(rows)
+
+    def invert(self, axis=1):
+        """
+        Gets inversion about ``axis`` as ``RatioSet.invert()`` does.
+
+        ..  container:: example
+
+            >>> microtones.RatioLattice([2, 4, 3]).invert()
+            RatioLattice(['1/2', '1/4', '1/3'], limit=47)
+
+            >>> microtones.RatioLattice([2, 4, 3]).invert(3)
+            RatioLattice(['9/2', '9/4', '3'], limit=47)
+
+        """
+        doubled_axis = [2 * _ for _ in self._get_vector(axis)]
+        inverse = map(operator.sub, itertools.cycle(doubled_axis), self._array)
+        return self._from_array(array.array("q", inverse))
+
+    def multiply(self, n):
+        """
+        Gets multiplication by ``n``.
+
+        ..  container:: example
+
+            >>> microtones.RatioLattice([1, "5/4", "3/2"]).multiply("2/3")
+            RatioLattice(['2/3', '5/6', '1'], limit=47)
+
+        """
+        vector = self._get_vector(n)
+        product = map(operator.add, self._array, itertools.cycle(vector))
+        return self._from_array(array.array("q", product))
+
+    def reduce_to_octave(self):
+        """
+        Gets lattice with every ratio moved the fewest octaves into ``[1, 2]``
+        as ``reduce_ratio_classes()`` does.
+
+        ..  container:: example
+
+            >>> microtones.RatioLattice([3, "1/5", 4, "1/2"]).reduce_to_octave()
+            RatioLattice(['3/2', '8/5', '2', '1'], limit=47)
+
+        ..  container:: example
+
+            Agrees with ratio class sets:
+
+            >>> lattice = microtones.RatioLattice([1, 2, 3, "1/5"])
+            >>> lattice.reduce_to_octave().to_ratio_class_set()
+            {1, 2, 3 / 2, 8 / 5}
+            <BLANKLINE>
+
+            >>> lattice.reduce_to_octave().to_ratio_class_set() == (
+            ...     lattice.to_ratio_class_set()
+            ... )
+            True
+
+        """
+        rows = []
+        for row in self._iterate_rows():
+            odd = self._to_fraction((0,) + row[1:])
+            exponent = _get_octave_exponent(odd.numerator, odd.denominator)
+            # powers of two above 1 stop at 2 rather than 1
+            if odd == 1 and 0 < row[0]:
+                exponent += 1
+            rows.append((exponent,) + row[1:])
+        return self._from_rows(rows)
+
+    def remove_octaves(self):
+        """
+        Gets lattice with exponents of 2 dropped.
+
+        Ratios an octave apart collapse to one odd ratio.
+
+        ..  container:: example
+
+            >>> microtones.RatioLattice([3, "3/2", "5/4"]).remove_octaves()
+            RatioLattice(['3', '5'], limit=47)
+
+        """
+        return self._from_rows((0,) + row[1:] for row in self._iterate_rows())
+
+    def to_ratio_class_set(self):
+        """
+        Changes lattice to ratio class set.
+
+        ..  container:: example
+
+            >>> microtones.RatioLattice([3, 5, 6]).to_ratio_class_set()
+            {3 / 2, 5 / 4}
+            <BLANKLINE>
+
+        """
+        return RatioClassSet(list(self))
+
+    def to_ratio_set(self):
+        """
+        Changes lattice to ratio set.
+
+        ..  container:: example
+
+            >>> microtones.RatioLattice([3, 5, 6]).to_ratio_set()
+            {3, 5, 6}
+            <BLANKLINE>
+
+        """
+        return RatioSet(list(self))
@@ -1,6 +1,35 @@
-import black
+import array
+import numbers
+
 import quicktions
 
+# "native" or "black"; black formatting is much slower
+repr_style = "native"
+
+
+def _black_format(string):
+    # black is slow to import and only needed for reprs
+    import black
+
+    return black.format_str(string, mode=black.mode.Mode())
+
+
+def _format_repr(items, brackets):
+    assert repr_style in ("black", "native"), repr(repr_style)
+    opening, closing = brackets
+    strings = [str(_) for _ in items]
+    if repr_style == "black":
+        return _black_format(opening + ", ".join(strings) + closing)
+    # mimics black: spaces around slashes and one item per line past 88 columns
+    strings = [_.replace("/", " / ") for _ in strings]
+    string = opening + ", ".join(strings) + closing
+    if len(string) <= 88:
+        return string + "\n"
+    if len(strings) == 1:
+        return f"{opening}\n    {strings[0]}\n{closing}\n"
+    lines = "".join(f"    {_},\n" for _ in strings)
+    return f"{opening}\n{lines}{closing}\n"
+
 
 def _flatten(lst):
     out = []
@@ -12,7 +41,329 @@ def _flatten(lst):
     return out
 
 
-class PitchClassSet:
+def _factor_integer(n, primes, exponents, sign):
+    # adds sign to exponents[i] for each factor primes[i] of positive n
+    for i, prime in enumerate(primes):
+        if n == 1:
+            return
+        while n % prime == 0:
+            exponents[i] += sign
+            n //= prime
+    if n != 1:
+        raise ValueError(f"{n!r} has prime factors greater than {primes[-1]}.")
+
+
+def _get_octave_exponent(numerator, denominator):
+    # least exponent with 1 <= numerator * 2**exponent / denominator
+    exponent = denominator.bit_length() - numerator.bit_length()
+    if 0 <= exponent:
+        return exponent + (numerator << exponent < denominator)
+    return exponent + (numerator < denominator << -exponent)
+
+
+def _shift_octaves(ratio, exponent):
+    if 0 < exponent:
+        return quicktions.Fraction(ratio.numerator << exponent, ratio.denominator)
+    if exponent < 0:
+        return quicktions.Fraction(ratio.numerator, ratio.denominator << -exponent)
+    return ratio
+
+
+def _constrain_to_octave(ratio):
+    # moves ratio the fewest octaves into [1/2, 2)
+    if 2 <= ratio:
+        return _shift_octaves(ratio, _get_octave_exponent(*ratio.as_integer_ratio()))
+    if 2 * ratio < 1:
+        exponent = _get_octave_exponent(*ratio.as_integer_ratio()) - 1
+        return _shift_octaves(ratio, exponent)
+    return ratio
+
+
+def reduce_ratio_classes(ratios):
+    """
+    Moves each of ``ratios`` the fewest octaves into ``[1, 2]``.
+
+    Shifts each ratio once by comparing bit lengths of numerator and
+    denominator instead of halving or doubling in a loop.
+
+    ..  container:: example
+
+        >>> microtones.reduce_ratio_classes([1023, "1/5", 4, "3/2", "1/2"])
+        [Fraction(1023, 512), Fraction(8, 5), Fraction(2, 1), Fraction(3, 2), Fraction(1, 1)]
+
+    ..  container:: example
+
+        Raises value error when a ratio is not positive:
+
+        >>> microtones.reduce_ratio_classes([0])
+        Traceback (most recent call last):
+            ...
+        ValueError: ratio must be positive: Fraction(0, 1).
+
+    """
+    reduced = []
+    for ratio in ratios:
+        ratio = quicktions.Fraction(ratio)
+        if ratio <= 0:
+            raise ValueError(f"ratio must be positive: {ratio!r}.")
+        numerator, denominator = ratio.numerator, ratio.denominator
+        exponent = _get_octave_exponent(numerator, denominator)
+        # powers of two above 1 stop at 2 rather than 1
+        if exponent < 0 and numerator == denominator << -exponent:
+            exponent += 1
+        reduced.append(_shift_octaves(ratio, exponent))
+    return reduced
+
+
+def _make_integer_array(integers):
+    # machine integers where they fit; larger JI terms fall back to a list
+    try:
+        return array.array("q", integers)
+    except OverflowError:
+        return list(integers)
+
+
+def _set_integer(integers, index, integer):
+    try:
+        integers[index] = integer
+    except OverflowError:
+        integers = list(integers)
+        integers[index] = integer
+    return integers
+
+
+class _FractionArray:
+    """
+    Fractions stored as parallel numerator and denominator integer arrays.
+    """
+
+    __slots__ = ("_denominators", "_is_shared", "_numerators")
+
+    def __init__(self, fractions):
+        # trusts fractions to be a list of quicktions.Fraction objects
+        self._numerators = _make_integer_array([_.numerator for _ in fractions])
+        self._denominators = _make_integer_array([_.denominator for _ in fractions])
+        # views read shared arrays, so owners copy before writing
+        self._is_shared = False
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            pairs = zip(self._numerators[index], self._denominators[index])
+            return [quicktions.Fraction(*_) for _ in pairs]
+        return quicktions.Fraction(self._numerators[index], self._denominators[index])
+
+    def __iter__(self):
+        return map(quicktions.Fraction, self._numerators, self._denominators)
+
+    def __len__(self):
+        return len(self._numerators)
+
+    def __setitem__(self, index, fraction):
+        self._numerators = _set_integer(self._numerators, index, fraction.numerator)
+        self._denominators = _set_integer(
+            self._denominators, index, fraction.denominator
+        )
+
+
+class _FractionView:
+    """
+    Lazy view of fraction array through index map and offset.
+
+    Reads item ``i`` of a length-``n`` view at ``(start + step * i) % n`` in
+    the array, adds ``offset`` and reduces by ``modulus`` when given. Views
+    compose retrograde, rotation and transposition without copying.
+    """
+
+    __slots__ = ("_array", "_modulus", "_offset", "_start", "_step")
+
+    def __init__(self, array_, start=0, step=1, offset=0, modulus=None):
+        self._array = array_
+        self._modulus = modulus
+        self._offset = offset
+        self._start = start
+        self._step = step
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[_] for _ in range(len(self))[index]]
+        index = range(len(self))[index]
+        return self._get_value((self._start + self._step * index) % len(self))
+
+    def __iter__(self):
+        length = len(self)
+        for i in range(length):
+            yield self._get_value((self._start + self._step * i) % length)
+
+    def __len__(self):
+        return len(self._array)
+
+    def _get_value(self, index):
+        value = self._array[index]
+        if self._offset:
+            value += self._offset
+            if self._modulus is not None:
+                value %= self._modulus
+        return value
+
+    def retrograde(self):
+        start = (self._start + self._step * (len(self) - 1)) % len(self)
+        return _FractionView(
+            self._array, start, -self._step, self._offset, self._modulus
+        )
+
+    def rotate(self, n):
+        start = (self._start + self._step * n) % len(self)
+        return _FractionView(
+            self._array, start, self._step, self._offset, self._modulus
+        )
+
+    def transpose(self, n):
+        offset = self._offset + n
+        if self._modulus is not None:
+            offset %= self._modulus
+        return _FractionView(
+            self._array, self._start, self._step, offset, self._modulus
+        )
+
+
+class _FractionCollection:
+    """
+    Fraction collection.
+
+    Subclasses choose policies: set or segment, pitch classes or ratio classes
+    modulo the octave, and additive or multiplicative inversion.
+    """
+
+    _is_class = False
+
+    _is_multiplicative = False
+
+    _is_set = False
+
+    def __init__(self, values):
+        values = [quicktions.Fraction(_) for _ in _flatten(values)]
+        self._initialize(self._normalize(values))
+
+    def __add__(self, argument):
+        argument = type(self)(argument)
+        return self._from_values(list(self._values) + list(argument._values))
+
+    def __contains__(self, argument):
+        try:
+            return argument in self._get_members()
+        except TypeError:
+            return False
+
+    def __getitem__(self, index):
+        if isinstance(index, slice) and self._is_set:
+            return tuple(self._values[index])
+        return self._values[index]
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return _format_repr(self._values, "{}" if self._is_set else "()")
+
+    def __str__(self):
+        opening, closing = "{}" if self._is_set else "()"
+        return opening + ", ".join(str(_) for _ in self._values) + closing
+
+    @classmethod
+    def _from_values(class_, values):
+        # trusts values to be fractions already normalized by class policy
+        collection = class_.__new__(class_)
+        collection._initialize(values)
+        return collection
+
+    def _get_members(self):
+        if self._members is None:
+            self._members = frozenset(self._values)
+        return self._members
+
+    def _initialize(self, values):
+        if self._is_set:
+            # dict keys deduplicate in insertion order
+            values = list(dict.fromkeys(values))
+        self._values = _FractionArray(values)
+        self._members = None
+
+    def _normalize(self, values):
+        if self._is_multiplicative:
+            if self._is_class:
+                return reduce_ratio_classes(values)
+            for value in values:
+                assert 0 < value
+        elif self._is_class:
+            return [_ % 12 for _ in values]
+        return values
+
+    def _from_view(self, view):
+        collection = type(self).__new__(type(self))
+        collection._values = view
+        collection._members = None
+        return collection
+
+    def _get_view(self):
+        if isinstance(self._values, _FractionView):
+            return self._values
+        self._values._is_shared = True
+        modulus = 12 if self._is_class and not self._is_multiplicative else None
+        return _FractionView(self._values, modulus=modulus)
+
+    def _materialize(self):
+        return self._from_values(list(self._values))
+
+    def _retrograde(self):
+        if not len(self):
+            return self._from_values([])
+        return self._from_view(self._get_view().retrograde())
+
+    def _rotate(self, n):
+        steps = int(n) % len(self)
+        return self._from_view(self._get_view().rotate(steps))
+
+    def _set_value(self, index, value):
+        values = self._values
+        if isinstance(values, _FractionView) or values._is_shared:
+            values = self._values = _FractionArray(list(values))
+        values[index] = value
+        self._members = None
+
+    def complement(self, scale):
+        members = self._get_members()
+        return type(self)([_ for _ in scale if _ not in members])
+
+    def invert(self, axis):
+        axis = quicktions.Fraction(axis)
+        if self._is_multiplicative:
+            assert 0 < axis
+            inverse = [axis * axis / _ for _ in self._values]
+        else:
+            inverse = [2 * axis - _ for _ in self._values]
+        return self._from_values(self._normalize(inverse))
+
+    def multiply(self, n):
+        n = quicktions.Fraction(n)
+        return self._from_values(self._normalize([n * _ for _ in self._values]))
+
+    def sorted(self):
+        return self._from_values(sorted(self._values))
+
+    def transpose(self, n):
+        n = quicktions.Fraction(n)
+        # octave reduction does not compose with additive transposition
+        if self._is_set or (self._is_class and self._is_multiplicative):
+            return self._from_values(self._normalize([_ + n for _ in self._values]))
+        if self._is_multiplicative and len(self):
+            assert 0 < min(self._values) + n
+        return self._from_view(self._get_view().transpose(n))
+
+
+class PitchClassSet(_FractionCollection):
     """
     Pitch Class Set.
 
@@ -21,6 +372,10 @@ class PitchClassSet:
 
     """
 
+    _is_class = True
+
+    _is_set = True
+
     def __init__(self, pitch_classes):
         """
         Can be initialized with list, tuple, or mixed contents.
@@ -40,12 +395,22 @@ class PitchClassSet:
             <BLANKLINE>
 
         """
-        pitch_classes = _flatten(pitch_classes)
-        temp = [quicktions.Fraction(pitch) % 12 for pitch in pitch_classes]
-        self.pitch_classes = []
-        for pitch in temp:
-            if pitch not in self.pitch_classes:
-                self.pitch_classes.append(pitch)
+        super().__init__(pitch_classes)
+
+    def __eq__(self, argument):
+        """
+        Is true when ``argument`` is a pitch class set with the same pitch classes
+        in any order.
+
+        ..  container:: example
+
+            >>> microtones.PitchClassSet([0, 1, 13]) == microtones.PitchClassSet([1, 0])
+            True
+
+        """
+        if not isinstance(argument, type(self)):
+            return False
+        return self._get_members() == argument._get_members()
 
     def __getitem__(self, index):
         """
@@ -57,7 +422,13 @@ class PitchClassSet:
             Fraction(0, 1)
 
         """
-        return self.pitch_classes[index]
+        return super().__getitem__(index)
+
+    def __hash__(self):
+        """
+        Hashes pitch class set.
+        """
+        return hash((type(self), self._get_members()))
 
     def __iter__(self):
         """
@@ -82,8 +453,7 @@ class PitchClassSet:
             39/5
 
         """
-        for pitch in self.pitch_classes:
-            yield pitch
+        return super().__iter__()
 
     def __len__(self):
         """
@@ -95,7 +465,7 @@ class PitchClassSet:
             3
 
         """
-        return len(self.pitch_classes)
+        return super().__len__()
 
     def __repr__(self):
         """
@@ -107,10 +477,41 @@ class PitchClassSet:
             {0, 1, 6}
             <BLANKLINE>
 
+        ..  container:: example
+
+            Formats like black, one item per line past 88 columns:
+
+            >>> microtones.PitchClassSet([f"{_}/7" for _ in range(1, 15)])
+            {
+                1 / 7,
+                2 / 7,
+                3 / 7,
+                4 / 7,
+                5 / 7,
+                6 / 7,
+                1,
+                8 / 7,
+                9 / 7,
+                10 / 7,
+                11 / 7,
+                12 / 7,
+                13 / 7,
+                2,
+            }
+            <BLANKLINE>
+
+            Set ``utilities.repr_style`` to ``"black"`` to format with black
+            itself:
+
+            >>> microtones.utilities.repr_style = "black"
+            >>> microtones.PitchClassSet([0, "1/2"])
+            {0, 1 / 2}
+            <BLANKLINE>
+
+            >>> microtones.utilities.repr_style = "native"
+
         """
-        string = str(self)
-        string = black.format_str(string, mode=black.mode.Mode())
-        return string
+        return super().__repr__()
 
     def __str__(self):
         """
@@ -122,13 +523,7 @@ class PitchClassSet:
             '{0, 1, 6}'
 
         """
-        output = "{"
-        for i, pitch in enumerate(self.pitch_classes):
-            output += f"{pitch}"
-            if i != len(self.pitch_classes) - 1:
-                output += ", "
-        output += "}"
-        return output
+        return super().__str__()
 
     def __add__(self, argument):
         """
@@ -143,9 +538,7 @@ class PitchClassSet:
             <BLANKLINE>
 
         """
-        argument = type(self)(argument)
-        items = self.pitch_classes + argument.pitch_classes
-        return type(self)(items)
+        return super().__add__(argument)
 
     def __contains__(self, argument):
         """
@@ -157,168 +550,606 @@ class PitchClassSet:
             >>> 6 in pc_set
             True
 
-            >>> 18 in pc_set
-            False
+            >>> 18 in pc_set
+            False
+
+            >>> pc_set = microtones.PitchClassSet([0, 1, 18])
+            >>> 6 in pc_set
+            True
+
+            >>> 18 in pc_set
+            False
+
+        """
+        return super().__contains__(argument)
+
+    @staticmethod
+    def _binary_value(i):
+        value = 0
+        for bit in i:
+            value += 2**bit
+        return value
+
+    def _get_normal_order(self, pitch_classes):
+        # returns rotation of sorted pitch classes with least binary value;
+        # ties keep the last rotation, else the first least rotation
+        if all(_.denominator == 1 for _ in pitch_classes):
+            mask = 0
+            for pitch_class in pitch_classes:
+                mask |= 1 << int(pitch_class)
+            # rotating mask right by a pitch class transposes it to zero
+            values = [
+                ((mask >> int(_)) | (mask << (12 - int(_)))) & 0xFFF
+                for _ in pitch_classes
+            ]
+        else:
+            values = []
+            for i, first in enumerate(pitch_classes):
+                rotation = pitch_classes[i:] + pitch_classes[:i]
+                values.append(self._binary_value([(_ - first) % 12 for _ in rotation]))
+        index = len(values) - 1
+        for i, value in enumerate(values[:-1]):
+            if value < values[index]:
+                index = i
+        rotation = pitch_classes[index:] + pitch_classes[:index]
+        return rotation, values[index]
+
+    def _initialize(self, values):
+        super()._initialize(values)
+        self._normal_order = None
+        self._prime_form = None
+
+    def _transpose_to_zero(self):
+        return self.transpose(-self[0])
+
+    @property
+    def pitch_classes(self):
+        """
+        Gets pitch classes in insertion order.
+
+        Returns a tuple where earlier versions exposed a mutable list, so
+        comparisons with lists are false; build a new set to change
+        contents.
+
+        ..  container:: example
+
+            >>> microtones.PitchClassSet([0, 1, 13]).pitch_classes
+            (Fraction(0, 1), Fraction(1, 1))
+
+        """
+        return tuple(self._values)
+
+    def complement(self, scale):
+        """
+        Gets complement in scale.
+
+        ..  container:: example
+
+            >>> pc_set = microtones.PitchClassSet([0, 1, 2])
+            >>> input_scale = [i for i in range(12)]
+            >>> pc_set.complement(input_scale)
+            {3, 4, 5, 6, 7, 8, 9, 10, 11}
+            <BLANKLINE>
+
+        """
+        return super().complement(scale)
+
+    def invert(self, axis=0):
+        """
+        Gets inversion.
+
+        ..  container:: example
+
+            >>> microtones.PitchClassSet([0, 1, 3]).invert()
+            {0, 11, 9}
+            <BLANKLINE>
+
+            >>> microtones.PitchClassSet([0, 1, 3]).invert(3)
+            {6, 5, 3}
+            <BLANKLINE>
+
+        """
+        return super().invert(axis)
+
+    def multiply(self, n):
+        """
+        Gets multiplication.
+
+        ..  container:: example
+
+            >>> microtones.PitchClassSet([0, 1, 3]).multiply(2)
+            {0, 2, 6}
+            <BLANKLINE>
+
+        """
+        return super().multiply(n)
+
+    def normal_order(self):
+        """
+        Gets normal order.
+
+        ..  container:: example
+
+            >>> microtones.PitchClassSet([0, 2, 1]).normal_order()
+            {0, 1, 2}
+            <BLANKLINE>
+
+        """
+        if self._normal_order is None:
+            pitch_classes = list(self._values)
+            if 1 < len(pitch_classes):
+                pitch_classes, _ = self._get_normal_order(sorted(pitch_classes))
+            self._normal_order = self._from_values(pitch_classes)
+        return self._normal_order
+
+    def prime_form(self):
+        """
+        Gets prime form.
+
+        ..  container:: example
+
+            >>> microtones.PitchClassSet([1, 3, 2]).prime_form()
+            {0, 1, 2}
+            <BLANKLINE>
+
+        ..  container:: example
+
+            Chooses the inversion unless the original packs more tightly:
+
+            >>> microtones.PitchClassSet([0, 4, 7]).prime_form()
+            {0, 3, 7}
+            <BLANKLINE>
+
+        """
+        if self._prime_form is None:
+            if len(self) < 2:
+                self._prime_form = self.normal_order()._transpose_to_zero()
+            else:
+                pitch_classes = sorted(self._values)
+                rotation, value = self._get_normal_order(pitch_classes)
+                inversion = sorted((-_) % 12 for _ in pitch_classes)
+                inverted_rotation, inverted_value = self._get_normal_order(inversion)
+                if not value < inverted_value:
+                    rotation = inverted_rotation
+                first = rotation[0]
+                pitch_classes = [(_ - first) % 12 for _ in rotation]
+                self._prime_form = self._from_values(pitch_classes)
+        return self._prime_form
+
+    def sorted(self):
+        """
+        Gets Pitch Class Set sorted in ascending order.
+
+        ..  container:: example
+
+            >>> microtones.PitchClassSet([2, 1, 0]).sorted()
+            {0, 1, 2}
+            <BLANKLINE>
+
+        """
+        return super().sorted()
+
+    def transpose(self, n):
+        """
+        Gets transposition.
+
+        ..  container:: example
+
+            >>> microtones.PitchClassSet([0, 1, 2]).transpose(2)
+            {2, 3, 4}
+            <BLANKLINE>
+
+            >>> microtones.PitchClassSet([0, 1, 3, 4, 5]).invert().transpose(1+3)
+            {4, 3, 1, 0, 11}
+            <BLANKLINE>
+
+        """
+        return super().transpose(n)
+
+
+class EDOPitchClassSet:
+    """
+    EDO Pitch Class Set.
+
+    Stores pitch classes of ``edo`` equal divisions of the octave as integer
+    steps in the bits of a Python int.
+
+    >>> from abjadext import microtones
+
+    ..  container:: example
+
+        >>> pc_set = microtones.EDOPitchClassSet([0, 4, 7])
+        >>> pc_set.mask
+        145
+
+        >>> pc_set.transpose(7)
+        EDOPitchClassSet([2, 7, 11], edo=12)
+
+        >>> pc_set | microtones.EDOPitchClassSet([11])
+        EDOPitchClassSet([0, 4, 7, 11], edo=12)
+
+    """
+
+    __slots__ = ("_edo", "_mask")
+
+    def __init__(self, steps=(), edo=12):
+        """
+        Can be initialized with list, tuple, or mixed contents of integer
+        steps.
+
+        ..  container:: example
+
+            >>> microtones.EDOPitchClassSet([0, (7, 14)], edo=24)
+            EDOPitchClassSet([0, 7, 14], edo=24)
+
+            >>> microtones.EDOPitchClassSet([-1, 25], edo=24)
+            EDOPitchClassSet([1, 23], edo=24)
+
+        """
+        assert isinstance(edo, int) and 0 < edo, repr(edo)
+        mask = 0
+        for step in _flatten(steps):
+            assert step == int(step), repr(step)
+            mask |= 1 << (int(step) % edo)
+        self._edo = edo
+        self._mask = mask
+
+    def __and__(self, argument):
+        """
+        Gets intersection.
+
+        ..  container:: example
+
+            >>> a = microtones.EDOPitchClassSet([0, 1, 2])
+            >>> a & microtones.EDOPitchClassSet([1, 2, 3])
+            EDOPitchClassSet([1, 2], edo=12)
+
+        """
+        self._check_edo(argument)
+        return self._from_mask(self._mask & argument._mask)
+
+    def __contains__(self, argument):
+        """
+        Is true when integer step ``argument`` is in set.
+
+        ..  container:: example
+
+            >>> pc_set = microtones.EDOPitchClassSet([0, 4, 7])
+            >>> 4 in pc_set, 16 in pc_set, 5 in pc_set
+            (True, True, False)
+
+        """
+        if not isinstance(argument, numbers.Integral):
+            return False
+        return bool(self._mask >> (argument % self._edo) & 1)
+
+    def __eq__(self, argument):
+        """
+        Is true when ``argument`` has same steps and EDO.
+
+        ..  container:: example
+
+            >>> microtones.EDOPitchClassSet([7, 0]) == microtones.EDOPitchClassSet([0, 7])
+            True
+
+            >>> microtones.EDOPitchClassSet([0], edo=12) == microtones.EDOPitchClassSet([0], edo=24)
+            False
+
+        """
+        if not isinstance(argument, type(self)):
+            return False
+        return self._edo == argument._edo and self._mask == argument._mask
+
+    def __hash__(self):
+        """
+        Hashes set.
+        """
+        return hash((type(self), self._edo, self._mask))
+
+    def __iter__(self):
+        """
+        Iterates steps in ascending order.
+
+        ..  container:: example
+
+            >>> list(microtones.EDOPitchClassSet([7, 0, 4]))
+            [0, 4, 7]
+
+        """
+        mask = self._mask
+        while mask:
+            low_bit = mask & -mask
+            yield low_bit.bit_length() - 1
+            mask ^= low_bit
+
+    def __len__(self):
+        """
+        Gets number of steps.
+
+        ..  container:: example
+
+            >>> len(microtones.EDOPitchClassSet([0, 4, 7]))
+            3
+
+        """
+        return bin(self._mask).count("1")
+
+    def __or__(self, argument):
+        """
+        Gets union.
+
+        ..  container:: example
+
+            >>> a = microtones.EDOPitchClassSet([0, 1])
+            >>> a | microtones.EDOPitchClassSet([1, 2])
+            EDOPitchClassSet([0, 1, 2], edo=12)
+
+        """
+        self._check_edo(argument)
+        return self._from_mask(self._mask | argument._mask)
+
+    def __repr__(self):
+        """
+        Gets interpreter representation.
+
+        ..  container:: example
+
+            >>> microtones.EDOPitchClassSet([0, 3, 7], edo=72)
+            EDOPitchClassSet([0, 3, 7], edo=72)
+
+        """
+        return f"{type(self).__name__}({list(self)}, edo={self._edo})"
+
+    def __sub__(self, argument):
+        """
+        Gets difference.
+
+        ..  container:: example
+
+            >>> a = microtones.EDOPitchClassSet([0, 1, 2])
+            >>> a - microtones.EDOPitchClassSet([1])
+            EDOPitchClassSet([0, 2], edo=12)
+
+        """
+        self._check_edo(argument)
+        return self._from_mask(self._mask & ~argument._mask)
+
+    def __xor__(self, argument):
+        """
+        Gets symmetric difference.
+
+        ..  container:: example
+
+            >>> a = microtones.EDOPitchClassSet([0, 1])
+            >>> a ^ microtones.EDOPitchClassSet([1, 2])
+            EDOPitchClassSet([0, 2], edo=12)
+
+        """
+        self._check_edo(argument)
+        return self._from_mask(self._mask ^ argument._mask)
+
+    def _check_edo(self, argument):
+        assert isinstance(argument, type(self)), repr(argument)
+        assert argument._edo == self._edo, repr(argument)
+
+    def _from_mask(self, mask):
+        return type(self).from_mask(mask, self._edo)
+
+    def _get_inverted_mask(self):
+        # reversing bits maps step i to edo - 1 - i; rotating by 1 maps it to -i
+        string = format(self._mask, f"0{self._edo}b")[::-1]
+        return self._rotate_mask(int(string, 2), 1)
+
+    def _rotate_mask(self, mask, n):
+        edo = self._edo
+        n %= edo
+        full = (1 << edo) - 1
+        return ((mask << n) | (mask >> (edo - n))) & full
+
+    @property
+    def edo(self):
+        """
+        Gets number of equal divisions of the octave.
+
+        ..  container:: example
+
+            >>> microtones.EDOPitchClassSet([0], edo=72).edo
+            72
+
+        """
+        return self._edo
+
+    @property
+    def mask(self):
+        """
+        Gets bitmask; bit ``i`` is set when step ``i`` is in set.
+
+        ..  container:: example
+
+            >>> bin(microtones.EDOPitchClassSet([0, 1, 6]).mask)
+            '0b1000011'
+
+        """
+        return self._mask
+
+    @classmethod
+    def from_mask(class_, mask, edo=12):
+        """
+        Makes set from bitmask.
+
+        ..  container:: example
 
-            >>> pc_set = microtones.PitchClassSet([0, 1, 18])
-            >>> 6 in pc_set
-            True
+            >>> microtones.EDOPitchClassSet.from_mask(0b10010001)
+            EDOPitchClassSet([0, 4, 7], edo=12)
 
-            >>> 18 in pc_set
-            False
+        """
+        assert isinstance(edo, int) and 0 < edo, repr(edo)
+        assert 0 <= mask < 1 << edo, repr(mask)
+        pc_set = class_.__new__(class_)
+        pc_set._edo = edo
+        pc_set._mask = mask
+        return pc_set
 
+    @classmethod
+    def from_pitch_class_set(class_, pitch_class_set, edo=12):
         """
-        return argument in self.pitch_classes
+        Makes set from Pitch Class Set of semitone values.
 
-    def _rotate(self, n):
-        copied_list = [i for i in self.pitch_classes]
-        steps = int(n) % len(copied_list)
-        copied_list_ = copied_list[steps:] + copied_list[:steps]
-        return type(self)(copied_list_)
+        ..  container:: example
 
-    def _transpose_to_zero(self):
-        return self.transpose(-self.pitch_classes[0])
+            >>> pc_set = microtones.PitchClassSet([0, "1/2", "7/6"])
+            >>> microtones.EDOPitchClassSet.from_pitch_class_set(pc_set, edo=72)
+            EDOPitchClassSet([0, 3, 7], edo=72)
 
-    @staticmethod
-    def _binary_value(i):
-        value = 0
-        for bit in i:
-            value += 2**bit
-        return value
+        """
+        steps = []
+        for pitch_class in pitch_class_set:
+            step = quicktions.Fraction(pitch_class) * edo / 12
+            assert step.denominator == 1, repr(pitch_class)
+            steps.append(step.numerator)
+        return class_(steps, edo)
 
-    def complement(self, scale):
+    def complement(self):
         """
-        Gets complement in scale.
+        Gets complement in EDO.
 
         ..  container:: example
 
-            >>> pc_set = microtones.PitchClassSet([0, 1, 2])
-            >>> input_scale = [i for i in range(12)]
-            >>> pc_set.complement(input_scale)
-            {3, 4, 5, 6, 7, 8, 9, 10, 11}
-            <BLANKLINE>
+            >>> microtones.EDOPitchClassSet([0, 2, 4, 5, 7, 9, 11]).complement()
+            EDOPitchClassSet([1, 3, 6, 8, 10], edo=12)
 
         """
-        complements = []
-        for pitch in scale:
-            if pitch not in self.pitch_classes:
-                complements.append(pitch)
-        return type(self)(complements)
+        return self._from_mask(self._mask ^ ((1 << self._edo) - 1))
 
     def invert(self, axis=0):
         """
-        Gets inversion.
+        Gets inversion about ``axis`` step.
 
         ..  container:: example
 
-            >>> microtones.PitchClassSet([0, 1, 3]).invert()
-            {0, 11, 9}
-            <BLANKLINE>
+            >>> microtones.EDOPitchClassSet([0, 1, 3]).invert()
+            EDOPitchClassSet([0, 9, 11], edo=12)
 
-            >>> microtones.PitchClassSet([0, 1, 3]).invert(3)
-            {6, 5, 3}
-            <BLANKLINE>
+            >>> microtones.EDOPitchClassSet([0, 1, 3]).invert(3)
+            EDOPitchClassSet([3, 5, 6], edo=12)
 
         """
-        axis = quicktions.Fraction(axis)
-        intervals = [axis - i for i in self.pitch_classes]
-        inverse = [axis + interval for interval in intervals]
-        return type(self)(inverse)
+        twice_axis = 2 * quicktions.Fraction(axis)
+        assert twice_axis.denominator == 1, repr(axis)
+        mask = self._rotate_mask(self._get_inverted_mask(), twice_axis.numerator)
+        return self._from_mask(mask)
 
-    def multiply(self, n):
+    def interval_vector(self):
         """
-        Gets multiplication.
+        Gets interval-class vector.
 
         ..  container:: example
 
-            >>> microtones.PitchClassSet([0, 1, 3]).multiply(2)
-            {0, 2, 6}
-            <BLANKLINE>
+            >>> microtones.EDOPitchClassSet([0, 4, 7]).interval_vector()
+            (0, 0, 1, 1, 1, 0)
+
+            >>> microtones.EDOPitchClassSet([0, 6]).interval_vector()
+            (0, 0, 0, 0, 0, 1)
 
         """
-        multiplied_pitch_classes = [
-            quicktions.Fraction(n) * pitch for pitch in self.pitch_classes
-        ]
-        return type(self)(multiplied_pitch_classes)
+        mask, vector = self._mask, []
+        for interval in range(1, self._edo // 2 + 1):
+            # bits set in both count pairs spanning interval upward
+            count = bin(mask & self._rotate_mask(mask, interval)).count("1")
+            if 2 * interval == self._edo:
+                count //= 2
+            vector.append(count)
+        return tuple(vector)
 
-    def normal_order(self):
+    def multiply(self, n):
         """
-        Gets normal order.
+        Gets multiplication.
 
         ..  container:: example
 
-            >>> microtones.PitchClassSet([0, 2, 1]).normal_order()
-            {0, 1, 2}
-            <BLANKLINE>
+            >>> microtones.EDOPitchClassSet([0, 1, 3]).multiply(5)
+            EDOPitchClassSet([0, 3, 5], edo=12)
 
         """
-        size = len(self.pitch_classes)
-        if size < 2:
-            return type(self)(self.pitch_classes)
-        original = self.sorted()
-        rotations = [original._rotate(n) for n in range(size)]
-        candidate = rotations.pop()
-        candidate_binary_value = self._binary_value(candidate._transpose_to_zero())
-        for rotation in rotations:
-            alternative_candidate_binary_value = self._binary_value(
-                rotation._transpose_to_zero()
-            )
-            if alternative_candidate_binary_value < candidate_binary_value:
-                candidate = rotation
-                candidate_binary_value = alternative_candidate_binary_value
-        return candidate
+        return type(self)([n * _ for _ in self], self._edo)
 
     def prime_form(self):
         """
         Gets prime form.
 
+        Chooses the transposition to zero of the set or its inversion with
+        least binary value, as ``PitchClassSet.prime_form()`` does.
+
         ..  container:: example
 
-            >>> microtones.PitchClassSet([1, 3, 2]).prime_form()
-            {0, 1, 2}
-            <BLANKLINE>
+            >>> microtones.EDOPitchClassSet([1, 3, 2]).prime_form()
+            EDOPitchClassSet([0, 1, 2], edo=12)
+
+            >>> microtones.EDOPitchClassSet([0, 4, 7]).prime_form()
+            EDOPitchClassSet([0, 3, 7], edo=12)
+
+            >>> microtones.EDOPitchClassSet([3, 10, 20], edo=24).prime_form()
+            EDOPitchClassSet([0, 7, 14], edo=24)
 
         """
-        original = self.normal_order()._transpose_to_zero()
-        inverted = self.invert().normal_order()._transpose_to_zero()
-        if self._binary_value(original) < self._binary_value(inverted):
-            return original
-        else:
-            return inverted
+        if not self._mask:
+            return self
+        inverted_mask = self._get_inverted_mask()
+        mask = min(self._rotate_mask(self._mask, -_) for _ in self)
+        inverted_steps = type(self).from_mask(inverted_mask, self._edo)
+        for step in inverted_steps:
+            mask = min(mask, self._rotate_mask(inverted_mask, -step))
+        return self._from_mask(mask)
 
-    def sorted(self):
+    def symmetry(self):
         """
-        Gets Pitch Class Set sorted in ascending order.
+        Gets number of transpositions and inversions that map set onto itself.
 
         ..  container:: example
 
-            >>> microtones.PitchClassSet([2, 1, 0]).sorted()
-            {0, 1, 2}
-            <BLANKLINE>
+            >>> microtones.EDOPitchClassSet([0, 4, 7]).symmetry()
+            1
+
+            >>> microtones.EDOPitchClassSet([0, 4, 8]).symmetry()
+            6
 
         """
-        return type(self)(sorted(self.pitch_classes))
+        mask, inverted_mask = self._mask, self._get_inverted_mask()
+        count = 0
+        for n in range(self._edo):
+            if self._rotate_mask(mask, n) == mask:
+                count += 1
+            if self._rotate_mask(inverted_mask, n) == mask:
+                count += 1
+        return count
 
-    def transpose(self, n):
+    def to_pitch_class_set(self):
         """
-        Gets transposition.
+        Changes set to Pitch Class Set of semitone values.
 
         ..  container:: example
 
-            >>> microtones.PitchClassSet([0, 1, 2]).transpose(2)
-            {2, 3, 4}
+            >>> microtones.EDOPitchClassSet([0, 3, 7], edo=72).to_pitch_class_set()
+            {0, 1 / 2, 7 / 6}
             <BLANKLINE>
 
-            >>> microtones.PitchClassSet([0, 1, 3, 4, 5]).invert().transpose(1+3)
-            {4, 3, 1, 0, 11}
-            <BLANKLINE>
+        """
+        return PitchClassSet([quicktions.Fraction(12 * _, self._edo) for _ in self])
+
+    def transpose(self, n):
+        """
+        Gets transposition by ``n`` steps.
+
+        ..  container:: example
+
+            >>> microtones.EDOPitchClassSet([0, 1, 11]).transpose(2)
+            EDOPitchClassSet([1, 2, 3], edo=12)
 
         """
-        transposed = [pitch + n for pitch in self.pitch_classes]
-        return type(self)(transposed)
+        return self._from_mask(self._rotate_mask(self._mask, n))
 
 
-class PitchSet:
+class PitchSet(_FractionCollection):
     """
     Pitch Set.
 
@@ -326,6 +1157,8 @@ class PitchSet:
 
     """
 
+    _is_set = True
+
     def __init__(self, pitches):
         """
         Can be initialized with list, tuple, or mixed contents.
@@ -345,12 +1178,22 @@ class PitchSet:
             <BLANKLINE>
 
         """
-        pitches = _flatten(pitches)
-        temp = [quicktions.Fraction(pitch) for pitch in pitches]
-        self.pitches = []
-        for pitch in temp:
-            if pitch not in self.pitches:
-                self.pitches.append(pitch)
+        super().__init__(pitches)
+
+    def __eq__(self, argument):
+        """
+        Is true when ``argument`` is a pitch set with the same pitches
+        in any order.
+
+        ..  container:: example
+
+            >>> microtones.PitchSet([0, 1, 6]) == microtones.PitchSet([6, 1, 0])
+            True
+
+        """
+        if not isinstance(argument, type(self)):
+            return False
+        return self._get_members() == argument._get_members()
 
     def __getitem__(self, index):
         """
@@ -362,7 +1205,13 @@ class PitchSet:
             Fraction(0, 1)
 
         """
-        return self.pitches[index]
+        return super().__getitem__(index)
+
+    def __hash__(self):
+        """
+        Hashes pitch set.
+        """
+        return hash((type(self), self._get_members()))
 
     def __iter__(self):
         """
@@ -378,8 +1227,7 @@ class PitchSet:
             Fraction(2, 1)
 
         """
-        for pitch in self.pitches:
-            yield pitch
+        return super().__iter__()
 
     def __len__(self):
         """
@@ -391,7 +1239,7 @@ class PitchSet:
             3
 
         """
-        return len(self.pitches)
+        return super().__len__()
 
     def __repr__(self):
         """
@@ -404,9 +1252,7 @@ class PitchSet:
             <BLANKLINE>
 
         """
-        string = str(self)
-        string = black.format_str(string, mode=black.mode.Mode())
-        return string
+        return super().__repr__()
 
     def __str__(self):
         """
@@ -418,13 +1264,7 @@ class PitchSet:
             '{0, 1, 2}'
 
         """
-        output = "{"
-        for i, pitch in enumerate(self.pitches):
-            output += f"{pitch}"
-            if i != len(self.pitches) - 1:
-                output += ", "
-        output += "}"
-        return output
+        return super().__str__()
 
     def __add__(self, argument):
         """
@@ -439,9 +1279,7 @@ class PitchSet:
             <BLANKLINE>
 
         """
-        argument = type(self)(argument)
-        items = self.pitches + argument.pitches
-        return type(self)(items)
+        return super().__add__(argument)
 
     def __contains__(self, argument):
         """
@@ -464,16 +1302,27 @@ class PitchSet:
             True
 
         """
-        return argument in self.pitches
-
-    def _rotate(self, n):
-        copied_list = [i for i in self.pitches]
-        steps = int(n) % len(copied_list)
-        copied_list_ = copied_list[steps:] + copied_list[:steps]
-        return type(self)(copied_list_)
+        return super().__contains__(argument)
 
     def _transpose_to_zero(self):
-        return self.transpose(-self.pitches[0])
+        return self.transpose(-self[0])
+
+    @property
+    def pitches(self):
+        """
+        Gets pitches in insertion order.
+
+        Returns a tuple where earlier versions exposed a mutable list, so
+        comparisons with lists are false; build a new set to change
+        contents.
+
+        ..  container:: example
+
+            >>> microtones.PitchSet([0, 1, 13]).pitches
+            (Fraction(0, 1), Fraction(1, 1), Fraction(13, 1))
+
+        """
+        return tuple(self._values)
 
     def complement(self, scale):
         """
@@ -488,11 +1337,7 @@ class PitchSet:
             <BLANKLINE>
 
         """
-        complements = []
-        for pitch in scale:
-            if pitch not in self.pitches:
-                complements.append(pitch)
-        return type(self)(complements)
+        return super().complement(scale)
 
     def invert(self, axis=0):
         """
@@ -509,10 +1354,7 @@ class PitchSet:
             <BLANKLINE>
 
         """
-        axis = quicktions.Fraction(axis)
-        intervals = [axis - i for i in self.pitches]
-        inverse = [axis + interval for interval in intervals]
-        return type(self)(inverse)
+        return super().invert(axis)
 
     def multiply(self, n):
         """
@@ -525,8 +1367,7 @@ class PitchSet:
             <BLANKLINE>
 
         """
-        multiplied_pitches = [quicktions.Fraction(n) * pitch for pitch in self.pitches]
-        return type(self)(multiplied_pitches)
+        return super().multiply(n)
 
     def sorted(self):
         """
@@ -539,7 +1380,7 @@ class PitchSet:
             <BLANKLINE>
 
         """
-        return type(self)(sorted(self.pitches))
+        return super().sorted()
 
     def transpose(self, n):
         """
@@ -556,11 +1397,10 @@ class PitchSet:
             <BLANKLINE>
 
         """
-        transposed = [pitch + n for pitch in self.pitches]
-        return type(self)(transposed)
+        return super().transpose(n)
 
 
-class PitchClassSegment:
+class PitchClassSegment(_FractionCollection):
     """
     Pitch Class Segment.
 
@@ -568,6 +1408,8 @@ class PitchClassSegment:
 
     """
 
+    _is_class = True
+
     def __init__(self, pitch_classes):
         """
         Can be initialized with list, tuple, or mixed contents.
@@ -587,10 +1429,7 @@ class PitchClassSegment:
             <BLANKLINE>
 
         """
-        pitch_classes = _flatten(pitch_classes)
-        self.pitch_classes = [
-            quicktions.Fraction(pitch) % 12 for pitch in pitch_classes
-        ]
+        super().__init__(pitch_classes)
 
     def __getitem__(self, index):
         """
@@ -602,7 +1441,7 @@ class PitchClassSegment:
             Fraction(0, 1)
 
         """
-        return self.pitch_classes[index]
+        return super().__getitem__(index)
 
     def __iter__(self):
         """
@@ -618,8 +1457,7 @@ class PitchClassSegment:
             Fraction(2, 1)
 
         """
-        for pitch in self.pitch_classes:
-            yield pitch
+        return super().__iter__()
 
     def __len__(self):
         """
@@ -631,7 +1469,7 @@ class PitchClassSegment:
             3
 
         """
-        return len(self.pitch_classes)
+        return super().__len__()
 
     def __repr__(self):
         """
@@ -644,9 +1482,7 @@ class PitchClassSegment:
             <BLANKLINE>
 
         """
-        string = str(self)
-        string = black.format_str(string, mode=black.mode.Mode())
-        return string
+        return super().__repr__()
 
     def __str__(self):
         """
@@ -658,13 +1494,7 @@ class PitchClassSegment:
             '(0, 1, 2)'
 
         """
-        output = "("
-        for i, pitch in enumerate(self.pitch_classes):
-            output += f"{pitch}"
-            if i != len(self.pitch_classes) - 1:
-                output += ", "
-        output += ")"
-        return output
+        return super().__str__()
 
     def __add__(self, argument):
         """
@@ -679,9 +1509,7 @@ class PitchClassSegment:
             <BLANKLINE>
 
         """
-        argument = type(self)(argument)
-        items = self.pitch_classes + argument.pitch_classes
-        return type(self)(items)
+        return super().__add__(argument)
 
     def __contains__(self, argument):
         """
@@ -704,10 +1532,27 @@ class PitchClassSegment:
             False
 
         """
-        return argument in self.pitch_classes
+        return super().__contains__(argument)
 
     def _transpose_to_zero(self):
-        return self.transpose(-self.pitch_classes[0])
+        return self.transpose(-self[0])
+
+    @property
+    def pitch_classes(self):
+        """
+        Gets pitch classes.
+
+        Returns a tuple where earlier versions exposed a mutable list, so
+        comparisons with lists are false and changing the result raises type
+        error instead of changing the segment.
+
+        ..  container:: example
+
+            >>> microtones.PitchClassSegment([0, 1, 13]).pitch_classes
+            (Fraction(0, 1), Fraction(1, 1), Fraction(1, 1))
+
+        """
+        return tuple(self._values)
 
     def complement(self, scale):
         """
@@ -722,11 +1567,7 @@ class PitchClassSegment:
             <BLANKLINE>
 
         """
-        complements = []
-        for pitch in scale:
-            if pitch not in self.pitch_classes:
-                complements.append(pitch)
-        return type(self)(complements)
+        return super().complement(scale)
 
     def invert(self, axis=0):
         """
@@ -743,10 +1584,25 @@ class PitchClassSegment:
             <BLANKLINE>
 
         """
-        axis = quicktions.Fraction(axis)
-        intervals = [axis - i for i in self.pitch_classes]
-        inverse = [axis + interval for interval in intervals]
-        return type(self)(inverse)
+        return super().invert(axis)
+
+    def materialize(self):
+        """
+        Gets segment with values copied out of lazy view.
+
+        Retrograde, rotation and transposition return views that share values
+        with the original segment; materializing copies values into storage of
+        the segment's own.
+
+        ..  container:: example
+
+            >>> segment = microtones.PitchClassSegment([0, 1, 6]).transpose(7).retrograde()
+            >>> segment.materialize()
+            (1, 8, 7)
+            <BLANKLINE>
+
+        """
+        return self._materialize()
 
     def multiply(self, n):
         """
@@ -759,10 +1615,7 @@ class PitchClassSegment:
             <BLANKLINE>
 
         """
-        multiplied_pitch_classes = [
-            quicktions.Fraction(n) * pitch for pitch in self.pitch_classes
-        ]
-        return type(self)(multiplied_pitch_classes)
+        return super().multiply(n)
 
     def retrograde(self):
         """
@@ -775,7 +1628,7 @@ class PitchClassSegment:
             <BLANKLINE>
 
         """
-        return type(self)(reversed(self.pitch_classes))
+        return self._retrograde()
 
     def rotate(self, n):
         """
@@ -788,10 +1641,7 @@ class PitchClassSegment:
             <BLANKLINE>
 
         """
-        copied_list = [i for i in self.pitch_classes]
-        steps = int(n) % len(copied_list)
-        copied_list_ = copied_list[steps:] + copied_list[:steps]
-        return type(self)(copied_list_)
+        return self._rotate(n)
 
     def sorted(self):
         """
@@ -804,7 +1654,7 @@ class PitchClassSegment:
             <BLANKLINE>
 
         """
-        return type(self)(sorted(self.pitch_classes))
+        return super().sorted()
 
     def transpose(self, n):
         """
@@ -821,11 +1671,10 @@ class PitchClassSegment:
             <BLANKLINE>
 
         """
-        transposed = [pitch + n for pitch in self.pitch_classes]
-        return type(self)(transposed)
+        return super().transpose(n)
 
 
-class PitchSegment:
+class PitchSegment(_FractionCollection):
     """
     Pitch Segment.
 
@@ -852,8 +1701,7 @@ class PitchSegment:
             <BLANKLINE>
 
         """
-        pitches = _flatten(pitches)
-        self.pitches = [quicktions.Fraction(pitch) for pitch in pitches]
+        super().__init__(pitches)
 
     def __getitem__(self, index):
         """
@@ -865,7 +1713,7 @@ class PitchSegment:
             Fraction(0, 1)
 
         """
-        return self.pitches[index]
+        return super().__getitem__(index)
 
     def __setitem__(self, index, data):
         """
@@ -880,7 +1728,7 @@ class PitchSegment:
             <BLANKLINE>
 
         """
-        self.pitches[index] = quicktions.Fraction(data)
+        self._set_value(index, quicktions.Fraction(data))
 
     def __iter__(self):
         """
@@ -896,8 +1744,7 @@ class PitchSegment:
             Fraction(2, 1)
 
         """
-        for pitch in self.pitches:
-            yield pitch
+        return super().__iter__()
 
     def __len__(self):
         """
@@ -909,7 +1756,7 @@ class PitchSegment:
             3
 
         """
-        return len(self.pitches)
+        return super().__len__()
 
     def __repr__(self):
         """
@@ -922,9 +1769,7 @@ class PitchSegment:
             <BLANKLINE>
 
         """
-        string = str(self)
-        string = black.format_str(string, mode=black.mode.Mode())
-        return string
+        return super().__repr__()
 
     def __str__(self):
         """
@@ -936,13 +1781,7 @@ class PitchSegment:
             '(0, 1, 2)'
 
         """
-        output = "("
-        for i, pitch in enumerate(self.pitches):
-            output += f"{pitch}"
-            if i != len(self.pitches) - 1:
-                output += ", "
-        output += ")"
-        return output
+        return super().__str__()
 
     def __add__(self, argument):
         """
@@ -957,9 +1796,7 @@ class PitchSegment:
             <BLANKLINE>
 
         """
-        argument = type(self)(argument)
-        items = self.pitches + argument.pitches
-        return type(self)(items)
+        return super().__add__(argument)
 
     def __contains__(self, argument):
         """
@@ -982,10 +1819,27 @@ class PitchSegment:
             True
 
         """
-        return argument in self.pitches
+        return super().__contains__(argument)
 
     def _transpose_to_zero(self):
-        return self.transpose(-self.pitches[0])
+        return self.transpose(-self[0])
+
+    @property
+    def pitches(self):
+        """
+        Gets pitches.
+
+        Returns a tuple where earlier versions exposed a mutable list, so
+        comparisons with lists are false and changing the result raises type
+        error; set items on the segment instead.
+
+        ..  container:: example
+
+            >>> microtones.PitchSegment([0, 1, 13]).pitches
+            (Fraction(0, 1), Fraction(1, 1), Fraction(13, 1))
+
+        """
+        return tuple(self._values)
 
     def complement(self, scale):
         """
@@ -1000,11 +1854,7 @@ class PitchSegment:
             <BLANKLINE>
 
         """
-        complements = []
-        for pitch in scale:
-            if pitch not in self.pitches:
-                complements.append(pitch)
-        return type(self)(complements)
+        return super().complement(scale)
 
     def invert(self, axis=0):
         """
@@ -1021,10 +1871,25 @@ class PitchSegment:
             <BLANKLINE>
 
         """
-        axis = quicktions.Fraction(axis)
-        intervals = [axis - i for i in self.pitches]
-        inverse = [axis + interval for interval in intervals]
-        return type(self)(inverse)
+        return super().invert(axis)
+
+    def materialize(self):
+        """
+        Gets segment with values copied out of lazy view.
+
+        Retrograde, rotation and transposition return views that share values
+        with the original segment; materializing copies values into storage of
+        the segment's own.
+
+        ..  container:: example
+
+            >>> segment = microtones.PitchSegment([0, 1, 6]).transpose(2).retrograde()
+            >>> segment.materialize()
+            (8, 3, 2)
+            <BLANKLINE>
+
+        """
+        return self._materialize()
 
     def multiply(self, n):
         """
@@ -1037,8 +1902,7 @@ class PitchSegment:
             <BLANKLINE>
 
         """
-        multiplied_pitches = [quicktions.Fraction(n) * pitch for pitch in self.pitches]
-        return type(self)(multiplied_pitches)
+        return super().multiply(n)
 
     def retrograde(self):
         """
@@ -1051,7 +1915,7 @@ class PitchSegment:
             <BLANKLINE>
 
         """
-        return type(self)(reversed(self.pitches))
+        return self._retrograde()
 
     def rotate(self, n):
         """
@@ -1064,10 +1928,7 @@ class PitchSegment:
             <BLANKLINE>
 
         """
-        copied_list = [i for i in self.pitches]
-        steps = int(n) % len(copied_list)
-        copied_list_ = copied_list[steps:] + copied_list[:steps]
-        return type(self)(copied_list_)
+        return self._rotate(n)
 
     def sorted(self):
         """
@@ -1080,7 +1941,7 @@ class PitchSegment:
             <BLANKLINE>
 
         """
-        return type(self)(sorted(self.pitches))
+        return super().sorted()
 
     def transpose(self, n):
         """
@@ -1097,11 +1958,10 @@ class PitchSegment:
             <BLANKLINE>
 
         """
-        transposed = [pitch + n for pitch in self.pitches]
-        return type(self)(transposed)
+        return super().transpose(n)
 
 
-class RatioClassSet:
+class RatioClassSet(_FractionCollection):
     """
     Ratio Class Set.
 
@@ -1110,6 +1970,12 @@ class RatioClassSet:
 
     """
 
+    _is_class = True
+
+    _is_multiplicative = True
+
+    _is_set = True
+
     def __init__(self, ratio_classes):
         """
         Can be initialized with list, tuple, or mixed contents
@@ -1129,17 +1995,22 @@ class RatioClassSet:
             <BLANKLINE>
 
         """
-        ratio_classes = _flatten(ratio_classes)
-        self.ratio_classes = []
-        for ratio in ratio_classes:
-            ratio = quicktions.Fraction(ratio)
-            assert 0 < ratio
-            while 2 < ratio:
-                ratio /= 2
-            while ratio < 1:
-                ratio *= 2
-            if ratio not in self.ratio_classes:
-                self.ratio_classes.append(ratio)
+        super().__init__(ratio_classes)
+
+    def __eq__(self, argument):
+        """
+        Is true when ``argument`` is a ratio class set with the same ratio
+        classes in any order.
+
+        ..  container:: example
+
+            >>> microtones.RatioClassSet([1, 3, 5]) == microtones.RatioClassSet([5, 3, 1])
+            True
+
+        """
+        if not isinstance(argument, type(self)):
+            return False
+        return self._get_members() == argument._get_members()
 
     def __getitem__(self, index):
         """
@@ -1151,7 +2022,13 @@ class RatioClassSet:
             Fraction(1, 1)
 
         """
-        return self.ratio_classes[index]
+        return super().__getitem__(index)
+
+    def __hash__(self):
+        """
+        Hashes ratio class set.
+        """
+        return hash((type(self), self._get_members()))
 
     def __iter__(self):
         """
@@ -1175,8 +2052,7 @@ class RatioClassSet:
             113/80
 
         """
-        for ratio in self.ratio_classes:
-            yield ratio
+        return super().__iter__()
 
     def __len__(self):
         """
@@ -1188,7 +2064,7 @@ class RatioClassSet:
             3
 
         """
-        return len(self.ratio_classes)
+        return super().__len__()
 
     def __repr__(self):
         """
@@ -1201,9 +2077,7 @@ class RatioClassSet:
             <BLANKLINE>
 
         """
-        string = str(self)
-        string = black.format_str(string, mode=black.mode.Mode())
-        return string
+        return super().__repr__()
 
     def __str__(self):
         """
@@ -1215,13 +2089,7 @@ class RatioClassSet:
             '{1, 2, 3/2}'
 
         """
-        output = "{"
-        for i, ratio in enumerate(self.ratio_classes):
-            output += f"{ratio}"
-            if i != len(self.ratio_classes) - 1:
-                output += ", "
-        output += "}"
-        return output
+        return super().__str__()
 
     def __add__(self, argument):
         """
@@ -1236,9 +2104,7 @@ class RatioClassSet:
             <BLANKLINE>
 
         """
-        argument = type(self)(argument)
-        items = self.ratio_classes + argument.ratio_classes
-        return type(self)(items)
+        return super().__add__(argument)
 
     def __contains__(self, argument):
         """
@@ -1251,7 +2117,48 @@ class RatioClassSet:
             True
 
         """
-        return argument in self.ratio_classes
+        return super().__contains__(argument)
+
+    @staticmethod
+    def _get_normal_order(ratio_classes):
+        # ratio_classes are sorted in [1, 2); returns rotation whose
+        # transposition to 1 is least when compared from the top down, and
+        # that transposition
+        best_index, best_key = 0, None
+        for i, first in enumerate(ratio_classes):
+            transposition = [_ / first for _ in ratio_classes[i:]]
+            transposition.extend(2 * _ / first for _ in ratio_classes[:i])
+            key = transposition[::-1]
+            if best_key is None or key < best_key:
+                best_index, best_key = i, key
+        rotation = ratio_classes[best_index:] + ratio_classes[:best_index]
+        return rotation, tuple(best_key[::-1])
+
+    def _get_octave_classes(self):
+        # identifies 2 with 1 so every class lies in [1, 2)
+        return sorted({_ if _ < 2 else _ / 2 for _ in self._values})
+
+    def _initialize(self, values):
+        super()._initialize(values)
+        self._normal_order = None
+        self._prime_form = None
+
+    @property
+    def ratio_classes(self):
+        """
+        Gets ratio classes in insertion order.
+
+        Returns a tuple where earlier versions exposed a mutable list, so
+        comparisons with lists are false; build a new set to change
+        contents.
+
+        ..  container:: example
+
+            >>> microtones.RatioClassSet([1, 3, 6]).ratio_classes
+            (Fraction(1, 1), Fraction(3, 2))
+
+        """
+        return tuple(self._values)
 
     def complement(self, scale):
         """
@@ -1267,11 +2174,7 @@ class RatioClassSet:
             <BLANKLINE>
 
         """
-        complements = []
-        for ratio in scale:
-            if ratio not in self.ratio_classes:
-                complements.append(ratio)
-        return type(self)(complements)
+        return super().complement(scale)
 
     def invert(self, axis=1):
         """
@@ -1290,11 +2193,7 @@ class RatioClassSet:
             <BLANKLINE>
 
         """
-        axis = quicktions.Fraction(axis)
-        assert 0 < axis
-        inverse = [axis / i for i in self.ratio_classes]
-        inverse = [axis * ratio for ratio in inverse]
-        return type(self)(inverse)
+        return super().invert(axis)
 
     def multiply(self, n):
         """
@@ -1308,10 +2207,70 @@ class RatioClassSet:
             <BLANKLINE>
 
         """
-        multiplied_pitch_classes = [
-            quicktions.Fraction(n) * ratio for ratio in self.ratio_classes
-        ]
-        return type(self)(multiplied_pitch_classes)
+        return super().multiply(n)
+
+    def normal_order(self):
+        """
+        Gets normal order.
+
+        Sorts ratio classes, identifying ``2`` with ``1``, and chooses the
+        rotation that packs most tightly from the top down.
+
+        ..  container:: example
+
+            >>> microtones.RatioClassSet(["5/3", "5/4", 1]).normal_order()
+            {5 / 3, 1, 5 / 4}
+            <BLANKLINE>
+
+        """
+        if self._normal_order is None:
+            ratio_classes = self._get_octave_classes()
+            if ratio_classes:
+                ratio_classes, _ = self._get_normal_order(ratio_classes)
+            self._normal_order = self._from_values(list(ratio_classes))
+        return self._normal_order
+
+    def prime_form(self):
+        """
+        Gets prime form.
+
+        Transposes the most tightly packed normal order of the set or its
+        inversion to begin on ``1``. Prime forms are cached and hashable, so
+        sets may be bucketed by transposition and inversion in a dict.
+
+        ..  container:: example
+
+            >>> microtones.RatioClassSet([4, 5, 6]).prime_form()
+            {1, 6 / 5, 3 / 2}
+            <BLANKLINE>
+
+            >>> microtones.RatioClassSet([10, 12, 15]).prime_form()
+            {1, 6 / 5, 3 / 2}
+            <BLANKLINE>
+
+        ..  container:: example
+
+            >>> chords = [[4, 5, 6], [3, 4, 5], [10, 12, 15], [4, 5, 7]]
+            >>> buckets = {}
+            >>> for chord in chords:
+            ...     rc_set = microtones.RatioClassSet(chord)
+            ...     buckets.setdefault(rc_set.prime_form(), []).append(chord)
+            ...
+            >>> len(buckets)
+            2
+
+        """
+        if self._prime_form is None:
+            ratio_classes = self._get_octave_classes()
+            if ratio_classes:
+                _, transposition = self._get_normal_order(ratio_classes)
+                inversion = sorted(2 / _ if 1 < _ else _ for _ in ratio_classes)
+                _, inverted_transposition = self._get_normal_order(inversion)
+                if inverted_transposition[::-1] < transposition[::-1]:
+                    transposition = inverted_transposition
+                ratio_classes = transposition
+            self._prime_form = self._from_values(list(ratio_classes))
+        return self._prime_form
 
     def sorted(self):
         """
@@ -1325,7 +2284,7 @@ class RatioClassSet:
             <BLANKLINE>
 
         """
-        return type(self)(sorted(self.ratio_classes))
+        return super().sorted()
 
     def transpose(self, n):
         """
@@ -1344,11 +2303,10 @@ class RatioClassSet:
             <BLANKLINE>
 
         """
-        transposed = [ratio + quicktions.Fraction(n) for ratio in self.ratio_classes]
-        return type(self)(transposed)
+        return super().transpose(n)
 
 
-class RatioSet:
+class RatioSet(_FractionCollection):
     """
     Ratio Set.
 
@@ -1356,6 +2314,10 @@ class RatioSet:
 
     """
 
+    _is_multiplicative = True
+
+    _is_set = True
+
     def __init__(self, ratios):
         """
         Can be initialized with list, tuple, or mixed contents
@@ -1375,13 +2337,22 @@ class RatioSet:
             <BLANKLINE>
 
         """
-        ratios = _flatten(ratios)
-        self.ratios = []
-        for ratio in ratios:
-            ratio = quicktions.Fraction(ratio)
-            assert 0 < ratio
-            if ratio not in self.ratios:
-                self.ratios.append(ratio)
+        super().__init__(ratios)
+
+    def __eq__(self, argument):
+        """
+        Is true when ``argument`` is a ratio set with the same ratios
+        in any order.
+
+        ..  container:: example
+
+            >>> microtones.RatioSet([1, 3, 5]) == microtones.RatioSet([5, 3, 1])
+            True
+
+        """
+        if not isinstance(argument, type(self)):
+            return False
+        return self._get_members() == argument._get_members()
 
     def __getitem__(self, index):
         """
@@ -1393,7 +2364,13 @@ class RatioSet:
             Fraction(1, 1)
 
         """
-        return self.ratios[index]
+        return super().__getitem__(index)
+
+    def __hash__(self):
+        """
+        Hashes ratio set.
+        """
+        return hash((type(self), self._get_members()))
 
     def __iter__(self):
         """
@@ -1417,8 +2394,7 @@ class RatioSet:
             113/10
 
         """
-        for ratio in self.ratios:
-            yield ratio
+        return super().__iter__()
 
     def __len__(self):
         """
@@ -1430,7 +2406,7 @@ class RatioSet:
             3
 
         """
-        return len(self.ratios)
+        return super().__len__()
 
     def __repr__(self):
         """
@@ -1443,9 +2419,7 @@ class RatioSet:
             <BLANKLINE>
 
         """
-        string = str(self)
-        string = black.format_str(string, mode=black.mode.Mode())
-        return string
+        return super().__repr__()
 
     def __str__(self):
         """
@@ -1457,13 +2431,7 @@ class RatioSet:
             '{1, 2, 3}'
 
         """
-        output = "{"
-        for i, ratio in enumerate(self.ratios):
-            output += f"{ratio}"
-            if i != len(self.ratios) - 1:
-                output += ", "
-        output += "}"
-        return output
+        return super().__str__()
 
     def __add__(self, argument):
         """
@@ -1479,9 +2447,7 @@ class RatioSet:
             <BLANKLINE>
 
         """
-        argument = type(self)(argument)
-        items = self.ratios + argument.ratios
-        return type(self)(items)
+        return super().__add__(argument)
 
     def __contains__(self, argument):
         """
@@ -1494,7 +2460,7 @@ class RatioSet:
             True
 
         """
-        return argument in self.ratios
+        return super().__contains__(argument)
 
     def constrain_to_octave(self):
         """
@@ -1506,14 +2472,25 @@ class RatioSet:
             '{1, 3/2, 4/5}'
 
         """
-        constrained = []
-        for ratio in self.ratios:
-            while 2 <= ratio:
-                ratio /= 2
-            while ratio < quicktions.Fraction(1, 2):
-                ratio *= 2
-            constrained.append(ratio)
-        return type(self)(constrained)
+        constrained = [_constrain_to_octave(_) for _ in self._values]
+        return self._from_values(constrained)
+
+    @property
+    def ratios(self):
+        """
+        Gets ratios in insertion order.
+
+        Returns a tuple where earlier versions exposed a mutable list, so
+        comparisons with lists are false; build a new set to change
+        contents.
+
+        ..  container:: example
+
+            >>> microtones.RatioSet([1, 3, 6]).ratios
+            (Fraction(1, 1), Fraction(3, 1), Fraction(6, 1))
+
+        """
+        return tuple(self._values)
 
     def complement(self, scale):
         """
@@ -1529,11 +2506,7 @@ class RatioSet:
             <BLANKLINE>
 
         """
-        complements = []
-        for ratio in scale:
-            if ratio not in self.ratios:
-                complements.append(ratio)
-        return type(self)(complements)
+        return super().complement(scale)
 
     def invert(self, axis=1):
         """
@@ -1552,11 +2525,7 @@ class RatioSet:
             <BLANKLINE>
 
         """
-        axis = quicktions.Fraction(axis)
-        assert 0 < axis
-        inverse = [axis / i for i in self.ratios]
-        inverse = [axis * ratio for ratio in inverse]
-        return type(self)(inverse)
+        return super().invert(axis)
 
     def multiply(self, n):
         """
@@ -1570,10 +2539,7 @@ class RatioSet:
             <BLANKLINE>
 
         """
-        multiplied_pitch_classes = [
-            quicktions.Fraction(n) * ratio for ratio in self.ratios
-        ]
-        return type(self)(multiplied_pitch_classes)
+        return super().multiply(n)
 
     def sorted(self):
         """
@@ -1587,7 +2553,7 @@ class RatioSet:
             <BLANKLINE>
 
         """
-        return type(self)(sorted(self.ratios))
+        return super().sorted()
 
     def transpose(self, n):
         """
@@ -1606,11 +2572,10 @@ class RatioSet:
             <BLANKLINE>
 
         """
-        transposed = [ratio + quicktions.Fraction(n) for ratio in self.ratios]
-        return type(self)(transposed)
+        return super().transpose(n)
 
 
-class RatioClassSegment:
+class RatioClassSegment(_FractionCollection):
     """
     Ratio Class Segment.
 
@@ -1618,6 +2583,10 @@ class RatioClassSegment:
 
     """
 
+    _is_class = True
+
+    _is_multiplicative = True
+
     def __init__(self, ratio_classes):
         """
         Can be initialized with list, tuple, or mixed contents
@@ -1637,16 +2606,7 @@ class RatioClassSegment:
             <BLANKLINE>
 
         """
-        ratio_classes = _flatten(ratio_classes)
-        self.ratio_classes = []
-        for ratio in ratio_classes:
-            ratio = quicktions.Fraction(ratio)
-            assert 0 < ratio
-            while 2 < ratio:
-                ratio /= 2
-            while ratio < 1:
-                ratio *= 2
-            self.ratio_classes.append(ratio)
+        super().__init__(ratio_classes)
 
     def __getitem__(self, index):
         """
@@ -1658,7 +2618,7 @@ class RatioClassSegment:
             Fraction(1, 1)
 
         """
-        return self.ratio_classes[index]
+        return super().__getitem__(index)
 
     def __iter__(self):
         """
@@ -1683,8 +2643,7 @@ class RatioClassSegment:
             113/80
 
         """
-        for ratio in self.ratio_classes:
-            yield ratio
+        return super().__iter__()
 
     def __len__(self):
         """
@@ -1696,7 +2655,7 @@ class RatioClassSegment:
             3
 
         """
-        return len(self.ratio_classes)
+        return super().__len__()
 
     def __repr__(self):
         """
@@ -1709,9 +2668,7 @@ class RatioClassSegment:
             <BLANKLINE>
 
         """
-        string = str(self)
-        string = black.format_str(string, mode=black.mode.Mode())
-        return string
+        return super().__repr__()
 
     def __str__(self):
         """
@@ -1723,13 +2680,7 @@ class RatioClassSegment:
             '(1, 2, 3/2)'
 
         """
-        output = "("
-        for i, ratio in enumerate(self.ratio_classes):
-            output += f"{ratio}"
-            if i != len(self.ratio_classes) - 1:
-                output += ", "
-        output += ")"
-        return output
+        return super().__str__()
 
     def __add__(self, argument):
         """
@@ -1745,9 +2696,7 @@ class RatioClassSegment:
             <BLANKLINE>
 
         """
-        argument = type(self)(argument)
-        items = self.ratio_classes + argument.ratio_classes
-        return type(self)(items)
+        return super().__add__(argument)
 
     def __contains__(self, argument):
         """
@@ -1760,7 +2709,24 @@ class RatioClassSegment:
             True
 
         """
-        return argument in self.ratio_classes
+        return super().__contains__(argument)
+
+    @property
+    def ratio_classes(self):
+        """
+        Gets ratio classes.
+
+        Returns a tuple where earlier versions exposed a mutable list, so
+        comparisons with lists are false and changing the result raises type
+        error instead of changing the segment.
+
+        ..  container:: example
+
+            >>> microtones.RatioClassSegment([1, 3, 6]).ratio_classes
+            (Fraction(1, 1), Fraction(3, 2), Fraction(3, 2))
+
+        """
+        return tuple(self._values)
 
     def complement(self, scale):
         """
@@ -1776,11 +2742,7 @@ class RatioClassSegment:
             <BLANKLINE>
 
         """
-        complements = []
-        for ratio in scale:
-            if ratio not in self.ratio_classes:
-                complements.append(ratio)
-        return type(self)(complements)
+        return super().complement(scale)
 
     def invert(self, axis=1):
         """
@@ -1799,11 +2761,25 @@ class RatioClassSegment:
             <BLANKLINE>
 
         """
-        axis = quicktions.Fraction(axis)
-        assert 0 < axis
-        inverse = [axis / i for i in self.ratio_classes]
-        inverse = [axis * ratio for ratio in inverse]
-        return type(self)(inverse)
+        return super().invert(axis)
+
+    def materialize(self):
+        """
+        Gets segment with values copied out of lazy view.
+
+        Retrograde, rotation and transposition return views that share values
+        with the original segment; materializing copies values into storage of
+        the segment's own.
+
+        ..  container:: example
+
+            >>> segment = microtones.RatioClassSegment([1, 3, 5]).rotate(1)
+            >>> segment.materialize()
+            (3 / 2, 5 / 4, 1)
+            <BLANKLINE>
+
+        """
+        return self._materialize()
 
     def multiply(self, n):
         """
@@ -1817,10 +2793,7 @@ class RatioClassSegment:
             <BLANKLINE>
 
         """
-        multiplied_pitch_classes = [
-            quicktions.Fraction(n) * ratio for ratio in self.ratio_classes
-        ]
-        return type(self)(multiplied_pitch_classes)
+        return super().multiply(n)
 
     def retrograde(self):
         """
@@ -1834,7 +2807,7 @@ class RatioClassSegment:
             <BLANKLINE>
 
         """
-        return type(self)(reversed(self.ratio_classes))
+        return self._retrograde()
 
     def rotate(self, n):
         """
@@ -1848,10 +2821,7 @@ class RatioClassSegment:
             <BLANKLINE>
 
         """
-        copied_list = [i for i in self.ratio_classes]
-        steps = int(n) % len(copied_list)
-        copied_list_ = copied_list[steps:] + copied_list[:steps]
-        return type(self)(copied_list_)
+        return self._rotate(n)
 
     def sorted(self):
         """
@@ -1865,7 +2835,7 @@ class RatioClassSegment:
             <BLANKLINE>
 
         """
-        return type(self)(sorted(self.ratio_classes))
+        return super().sorted()
 
     def transpose(self, n):
         """
@@ -1884,11 +2854,10 @@ class RatioClassSegment:
             <BLANKLINE>
 
         """
-        transposed = [ratio + quicktions.Fraction(n) for ratio in self.ratio_classes]
-        return type(self)(transposed)
+        return super().transpose(n)
 
 
-class RatioSegment:
+class RatioSegment(_FractionCollection):
     """
     Ratio Segment.
 
@@ -1896,6 +2865,8 @@ class RatioSegment:
 
     """
 
+    _is_multiplicative = True
+
     def __init__(self, ratios):
         """
         Can be initialized with list, tuple, or mixed contents
@@ -1915,12 +2886,7 @@ class RatioSegment:
             <BLANKLINE>
 
         """
-        ratios = _flatten(ratios)
-        self.ratios = []
-        for ratio in ratios:
-            ratio = quicktions.Fraction(ratio)
-            assert 0 < ratio
-            self.ratios.append(ratio)
+        super().__init__(ratios)
 
     def __getitem__(self, index):
         """
@@ -1932,7 +2898,7 @@ class RatioSegment:
             Fraction(1, 1)
 
         """
-        return self.ratios[index]
+        return super().__getitem__(index)
 
     def __setitem__(self, index, data):
         """
@@ -1947,7 +2913,7 @@ class RatioSegment:
             <BLANKLINE>
 
         """
-        self.ratios[index] = quicktions.Fraction(data)
+        self._set_value(index, quicktions.Fraction(data))
 
     def __iter__(self):
         """
@@ -1972,8 +2938,7 @@ class RatioSegment:
             113/10
 
         """
-        for ratio in self.ratios:
-            yield ratio
+        return super().__iter__()
 
     def __len__(self):
         """
@@ -1985,7 +2950,7 @@ class RatioSegment:
             3
 
         """
-        return len(self.ratios)
+        return super().__len__()
 
     def __repr__(self):
         """
@@ -1998,9 +2963,7 @@ class RatioSegment:
             <BLANKLINE>
 
         """
-        string = str(self)
-        string = black.format_str(string, mode=black.mode.Mode())
-        return string
+        return super().__repr__()
 
     def __str__(self):
         """
@@ -2012,13 +2975,7 @@ class RatioSegment:
             '(1, 2, 3)'
 
         """
-        output = "("
-        for i, ratio in enumerate(self.ratios):
-            output += f"{ratio}"
-            if i != len(self.ratios) - 1:
-                output += ", "
-        output += ")"
-        return output
+        return super().__str__()
 
     def __add__(self, argument):
         """
@@ -2034,9 +2991,7 @@ class RatioSegment:
             <BLANKLINE>
 
         """
-        argument = type(self)(argument)
-        items = self.ratios + argument.ratios
-        return type(self)(items)
+        return super().__add__(argument)
 
     def __contains__(self, argument):
         """
@@ -2049,7 +3004,24 @@ class RatioSegment:
             True
 
         """
-        return argument in self.ratios
+        return super().__contains__(argument)
+
+    @property
+    def ratios(self):
+        """
+        Gets ratios.
+
+        Returns a tuple where earlier versions exposed a mutable list, so
+        comparisons with lists are false and changing the result raises type
+        error; set items on the segment instead.
+
+        ..  container:: example
+
+            >>> microtones.RatioSegment([1, 3, 6]).ratios
+            (Fraction(1, 1), Fraction(3, 1), Fraction(6, 1))
+
+        """
+        return tuple(self._values)
 
     def constrain_to_octave(self):
         """
@@ -2061,14 +3033,8 @@ class RatioSegment:
             '(1, 3/2, 4/5)'
 
         """
-        constrained = []
-        for ratio in self.ratios:
-            while 2 <= ratio:
-                ratio /= 2
-            while ratio < quicktions.Fraction(1, 2):
-                ratio *= 2
-            constrained.append(ratio)
-        return type(self)(constrained)
+        constrained = [_constrain_to_octave(_) for _ in self._values]
+        return self._from_values(constrained)
 
     def complement(self, scale):
         """
@@ -2084,11 +3050,7 @@ class RatioSegment:
             <BLANKLINE>
 
         """
-        complements = []
-        for ratio in scale:
-            if ratio not in self.ratios:
-                complements.append(ratio)
-        return type(self)(complements)
+        return super().complement(scale)
 
     def invert(self, axis=1):
         """
@@ -2107,11 +3069,25 @@ class RatioSegment:
             <BLANKLINE>
 
         """
-        axis = quicktions.Fraction(axis)
-        assert 0 < axis
-        inverse = [axis / i for i in self.ratios]
-        inverse = [axis * ratio for ratio in inverse]
-        return type(self)(inverse)
+        return super().invert(axis)
+
+    def materialize(self):
+        """
+        Gets segment with values copied out of lazy view.
+
+        Retrograde, rotation and transposition return views that share values
+        with the original segment; materializing copies values into storage of
+        the segment's own.
+
+        ..  container:: example
+
+            >>> segment = microtones.RatioSegment([1, 3, 5]).transpose(1).rotate(1)
+            >>> segment.materialize()
+            (4, 6, 2)
+            <BLANKLINE>
+
+        """
+        return self._materialize()
 
     def multiply(self, n):
         """
@@ -2125,10 +3101,7 @@ class RatioSegment:
             <BLANKLINE>
 
         """
-        multiplied_pitch_classes = [
-            quicktions.Fraction(n) * ratio for ratio in self.ratios
-        ]
-        return type(self)(multiplied_pitch_classes)
+        return super().multiply(n)
 
     def retrograde(self):
         """
@@ -2142,7 +3115,7 @@ class RatioSegment:
             <BLANKLINE>
 
         """
-        return type(self)(reversed(self.ratios))
+        return self._retrograde()
 
     def rotate(self, n):
         """
@@ -2156,10 +3129,7 @@ class RatioSegment:
             <BLANKLINE>
 
         """
-        copied_list = [i for i in self.ratios]
-        steps = int(n) % len(copied_list)
-        copied_list_ = copied_list[steps:] + copied_list[:steps]
-        return type(self)(copied_list_)
+        return self._rotate(n)
 
     def sorted(self):
         """
@@ -2173,7 +3143,7 @@ class RatioSegment:
             <BLANKLINE>
 
         """
-        return type(self)(sorted(self.ratios))
+        return super().sorted()
 
     def transpose(self, n):
         """
@@ -2192,5 +3162,4 @@ class RatioSegment:
             <BLANKLINE>
 
         """
-        transposed = [ratio + quicktions.Fraction(n) for ratio in self.ratios]
-        return type(self)(transposed)
+        return super().transpose(n)
@@ -1,3 +1,5 @@
+import importlib.util
+
 import abjad
 import abjadext
 import pytest
@@ -9,3 +11,15 @@ def add_libraries(doctest_namespace):
     doctest_namespace["abjad"] = abjad
     doctest_namespace["abjadext"] = abjadext
     doctest_namespace["microtones"] = abjadext.microtones
+
+
+# doctests that need optional dependencies
+_requirements = {"ratios_to_cents_arrays": "numpy"}
+
+
+def pytest_collection_modifyitems(config, items):
+    for item in items:
+        name = item.name.rsplit(".", 1)[-1]
+        module = _requirements.get(name)
+        if module is not None and importlib.util.find_spec(module) is None:
+            item.add_marker(pytest.mark.skip(reason=f"requires {module}"))
@@ -28,11 +28,13 @@ if __name__ == "__main__":
             "Topic :: Artistic Software",
         ],
         extras_require={
+            "numpy": ["numpy"],
             "test": [
                 "black>=19.10b0",
                 "flake8>=3.8.2",
                 "isort>=4.3.21",
                 "mypy>=0.770",
+                "numpy",
                 "pytest>=5.4.2",
                 "pytest-cov>=2.6.0",
                 "pytest-helpers-namespace",
@@ -0,0 +1,51 @@
+import subprocess
+import sys
+
+
+def _run(code, *options):
+    completed_process = subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return completed_process
+
+
+def test_import_defers_heavy_dependencies():
+    code = "\n".join(
+        [
+            "import sys",
+            "import abjadext.microtones",
+            "names = ('abjad', 'black', 'numpy')",
+            "print(' '.join(_ for _ in names if _ in sys.modules))",
+        ]
+    )
+    assert _run(code).stdout.strip() == ""
+
+
+def test_import_resolves_public_names_on_access():
+    code = "\n".join(
+        [
+            "import sys",
+            "from abjadext import microtones",
+            "microtones.JIVector",
+            "print('abjad' in sys.modules, 'black' in sys.modules)",
+        ]
+    )
+    assert _run(code).stdout.strip() == "True False"
+
+
+def test_import_time():
+    """
+    Measures cold import cost of the package with ``python -X importtime``.
+    """
+    stderr = _run("import abjadext.microtones", "-X", "importtime").stderr
+    microseconds = None
+    for line in stderr.splitlines():
+        fields = [_.strip() for _ in line.split("|")]
+        if fields[-1] == "abjadext.microtones":
+            microseconds = int(fields[1])
+    assert microseconds is not None
+    print(f"cold import of abjadext.microtones: {microseconds / 1000:.1f} ms")
+    assert microseconds < 1_000_000